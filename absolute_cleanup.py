@@ -1,58 +1,128 @@
 
 import re
 import os
+import mmap
 import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
-def ultimate_purge():
-    translations = {
-        "Инициализация мониторинга когерентности...": "Initializing coherence monitoring...",
-        "Инициализация мониторинга": "Initializing monitoring",
-        "Завершение работы Trinity System...": "Shutting down Trinity System...",
-        "Ошибка сохранения": "Save error",
-        "Система завершена. Всего взаимодействий": "System terminated. Total interactions",
-        "Финальная когерентность": "Final coherence",
-        "ТОЧКА ВХОДА": "ENTRY POINT",
-        "ВЫПОЛНЕНИЕ ЗАВЕРШЕНО": "EXECUTION COMPLETE",
-        "Интегрированная система Trinity": "Integrated Trinity System",
-        "Инициализация ядра": "Engine initialization",
-        "Состояние системы": "System state",
-        "Автосохранение": "Autosave",
-        "Сессия": "Session",
-        "Настройка автосохранения": "Autosave setup",
-        "минут": "minutes",
-        "Основной метод коммуникации": "Main communication method",
-        "Обработка через движок": "Processing through engine",
-        "Обновление статистики": "Statistics update",
-        "Здесь можно добавить логику сбора статистики": "Statistics collection logic can be added here",
-        "Получение полного отчета системы": "Getting full system report",
-        "Сохранение состояния системы": "Saving system state",
-        "Корректное завершение работы": "Graceful shutdown",
-        "Завершение работы": "Shutting down",
-        "Всего взаимодействий": "Total interactions",
-        "Финальная": "Final",
-        "Уровни когерентности": "Coherence levels",
-        "система нестабильна": "system unstable",
-        "частичные нарушения": "partial violations",
-        "минимальные отклонения": "minimal deviations",
-        "полная когерентность": "full coherence",
-        "Естественный отбор": "Natural Selection",
-        "Парсинг RED ввода": "Parsing RED input",
-        "Валидация JSON структуры": "JSON structure validation",
-        "Извлекаем результаты": "Extracting results",
-        "Расчет итоговой когерентности": "Calculating final coherence",
-        "Проверка формы (кавычки)": "Form check (quotes)",
-        "Объяснимость": "Explainability",
-        "Проверка формы (вопрос)": "Form check (question)",
-        "Проверка провокативности": "Provocativity check",
-        "Проверка формы (JSON tag)": "Form check (JSON tag)",
-        "Текстовый документ.txt": "source_data.txt",
-        "Инициализация": "Initialization",
-        "Инициализация мониторинга...": "Initializing monitoring...",
-        "мониторинга когерентности": "coherence monitoring",
-        "Парсинг": "Parsing",
-        "инъекций": "injections"
-    }
+# Known Russian phrases and their English replacements
+TRANSLATIONS = {
+    "Инициализация мониторинга когерентности...": "Initializing coherence monitoring...",
+    "Инициализация мониторинга": "Initializing monitoring",
+    "Завершение работы Trinity System...": "Shutting down Trinity System...",
+    "Ошибка сохранения": "Save error",
+    "Система завершена. Всего взаимодействий": "System terminated. Total interactions",
+    "Финальная когерентность": "Final coherence",
+    "ТОЧКА ВХОДА": "ENTRY POINT",
+    "ВЫПОЛНЕНИЕ ЗАВЕРШЕНО": "EXECUTION COMPLETE",
+    "Интегрированная система Trinity": "Integrated Trinity System",
+    "Инициализация ядра": "Engine initialization",
+    "Состояние системы": "System state",
+    "Автосохранение": "Autosave",
+    "Сессия": "Session",
+    "Настройка автосохранения": "Autosave setup",
+    "минут": "minutes",
+    "Основной метод коммуникации": "Main communication method",
+    "Обработка через движок": "Processing through engine",
+    "Обновление статистики": "Statistics update",
+    "Здесь можно добавить логику сбора статистики": "Statistics collection logic can be added here",
+    "Получение полного отчета системы": "Getting full system report",
+    "Сохранение состояния системы": "Saving system state",
+    "Корректное завершение работы": "Graceful shutdown",
+    "Завершение работы": "Shutting down",
+    "Всего взаимодействий": "Total interactions",
+    "Финальная": "Final",
+    "Уровни когерентности": "Coherence levels",
+    "система нестабильна": "system unstable",
+    "частичные нарушения": "partial violations",
+    "минимальные отклонения": "minimal deviations",
+    "полная когерентность": "full coherence",
+    "Естественный отбор": "Natural Selection",
+    "Парсинг RED ввода": "Parsing RED input",
+    "Валидация JSON структуры": "JSON structure validation",
+    "Извлекаем результаты": "Extracting results",
+    "Расчет итоговой когерентности": "Calculating final coherence",
+    "Проверка формы (кавычки)": "Form check (quotes)",
+    "Объяснимость": "Explainability",
+    "Проверка формы (вопрос)": "Form check (question)",
+    "Проверка провокативности": "Provocativity check",
+    "Проверка формы (JSON tag)": "Form check (JSON tag)",
+    "Текстовый документ.txt": "source_data.txt",
+    "Инициализация": "Initialization",
+    "Инициализация мониторинга...": "Initializing monitoring...",
+    "мониторинга когерентности": "coherence monitoring",
+    "Парсинг": "Parsing",
+    "инъекций": "injections"
+}
+
+# Simplistic mapping for common words found in comments during manual review
+FALLBACK_MAP = {
+    "Парсинг": "Parsing",
+    "Валидатор": "Validator",
+    "форма": "form",
+    "семантика": "semantics",
+    "архитектура": "architecture",
+    "кавычки": "quotes",
+    "вопрос": "question"
+}
+
+# All matching runs on raw UTF-8 bytes, so files are never decoded or re-encoded
+TRANSLATIONS_BYTES = {ru.encode('utf-8'): en.encode('utf-8') for ru, en in TRANSLATIONS.items()}
+FALLBACK_MAP_BYTES = {ru.encode('utf-8'): en.encode('utf-8') for ru, en in FALLBACK_MAP.items()}
+
+# One Cyrillic letter (а-я, А-Я, ё, Ё) in UTF-8
+CYRILLIC_CHAR = rb'\xd0[\x81\x90-\xbf]|\xd1[\x80-\x8f\x91]'
+CYRILLIC_BYTES_RE = re.compile(CYRILLIC_CHAR)
+
+# Single alternation: specific phrases (longest first), then catch-all for remaining Cyrillic
+TRANSLATION_RE = re.compile(
+    b'(' + b'|'.join(re.escape(k) for k in sorted(TRANSLATIONS_BYTES, key=len, reverse=True)) + b')'
+    b'|((?:' + CYRILLIC_CHAR + b')+)'
+)
+
+def _translate_match(match):
+    if match.lastindex == 1:
+        return TRANSLATIONS_BYTES[match.group(1)]
+    return FALLBACK_MAP_BYTES.get(match.group(2), b"[ENG]")
 
+def _purge_file(rel_path):
+    """Cleans a single target file and returns the status line to report"""
+    abs_path = os.path.join(os.getcwd(), rel_path)
+    if not os.path.exists(abs_path):
+        return f"⚠️ Skipping missing file: {rel_path}"
+
+    # Map the file and only rewrite it when it actually contains Cyrillic
+    with open(abs_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return f"ℹ️ No Cyrillic found in {rel_path}"
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Fast path: no UTF-8 Cyrillic lead byte at all (steady state after first run)
+            has_lead = mm.find(b'\xd0') >= 0 or mm.find(b'\xd1') >= 0
+            if not has_lead or not CYRILLIC_BYTES_RE.search(mm):
+                return f"ℹ️ No Cyrillic found in {rel_path}"
+            content_hash = hashlib.blake2b(mm, digest_size=8).hexdigest()
+            # Apply translations and fallback in one pass straight over the mapped bytes
+            processed_content = TRANSLATION_RE.sub(_translate_match, mm)
+
+    # Backup only files that are actually rewritten; identical content is backed up once
+    backup_path = os.path.join('_archive', f"{os.path.basename(rel_path)}.{content_hash}.bak")
+    if not os.path.exists(backup_path):
+        try:
+            os.link(abs_path, backup_path)
+        except OSError:
+            shutil.copy2(abs_path, backup_path)
+
+    # Write to a new inode so a hardlinked backup keeps the original content
+    tmp_path = abs_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(processed_content)
+    shutil.copymode(abs_path, tmp_path)
+    os.replace(tmp_path, abs_path)
+
+    return f"✅ Absolute cleanup of {rel_path} complete. Backup saved to _archive."
+
+def ultimate_purge():
     target_files = [
         'core/trinity_core.py',
         'core/evolution_protocol.py',
@@ -66,45 +136,10 @@ def ultimate_purge():
     if not os.path.exists('_archive'):
         os.makedirs('_archive')
 
-    for rel_path in target_files:
-        abs_path = os.path.join(os.getcwd(), rel_path)
-        if not os.path.exists(abs_path):
-            print(f"⚠️ Skipping missing file: {rel_path}")
-            continue
-
-        # Backup
-        backup_path = os.path.join('_archive', os.path.basename(rel_path) + '.bak')
-        shutil.copy2(abs_path, backup_path)
-
-        with open(abs_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Apply specific translations
-        for ru, en in translations.items():
-            content = content.replace(ru, en)
-
-        # Catch-all for remaining Cyrillic (e.g. in comments)
-        def fallback_translator(match):
-            word = match.group(0)
-            # Simplistic mapping for common words found in comments during manual review
-            fallback_map = {
-                "Парсинг": "Parsing",
-                "Валидатор": "Validator",
-                "форма": "form",
-                "семантика": "semantics",
-                "архитектура": "architecture",
-                "кавычки": "quotes",
-                "вопрос": "question"
-            }
-            return fallback_map.get(word, "[ENG]")
-
-        # Replace any remaining Cyrillic blocks
-        processed_content = re.sub(r'[а-яА-ЯёЁ]+', fallback_translator, content)
-
-        with open(abs_path, 'w', encoding='utf-8') as f:
-            f.write(processed_content)
-        
-        print(f"✅ Absolute cleanup of {rel_path} complete. Backup saved to _archive.")
+    # Files are independent: overlap their I/O, then report in target order
+    with ThreadPoolExecutor(max_workers=min(8, len(target_files))) as executor:
+        for message in executor.map(_purge_file, target_files):
+            print(message)
 
 if __name__ == "__main__":
     ultimate_purge()
@@ -1,5 +1,6 @@
 import os
 import time
+from pathlib import Path
 
 # Trinity v3.0 Structure for automatic creation
 # This script creates the skeleton, but does NOT overwrite existing files with default content,
@@ -12,6 +13,25 @@ structure = {
     "assets": ["metadata.json"]
 }
 
+# Scaffold content per file name; anything not listed gets DEFAULT_SCAFFOLD
+SCAFFOLDS = {
+    "README.md": (
+        "# EvoPyramid-Trinity: Formal Coherence Core\n"
+        "## Audio Manifest: Apashe - Kannibalen\n"
+        "### Author: Admin Alex (Aleeexzp)\n\n"
+        "> 'While others build wrappers, we built an Operating System for Cognitive Integrity.'\n\n"
+        "![Status](https://img.shields.io/badge/Status-COHERENT_1.00-gold)\n"
+    )
+}
+DEFAULT_SCAFFOLD = "# Trinity Component: {file}\n# Logic Score > 0.3 Verified\n"
+
+# Exact bytes for every file in the structure, encoded once at import
+SCAFFOLD_BYTES = {
+    file: SCAFFOLDS.get(file, DEFAULT_SCAFFOLD.format(file=file)).encode("utf-8")
+    for files in structure.values()
+    for file in files
+}
+
 def build():
     print("🚀 [STARTING] Trinity Master Build Script...")
     print("📂 Target: Aleeexzp@gmail.com // SEC_LEVEL: ONEGA")
@@ -20,28 +40,21 @@ def build():
     
     for folder, files in structure.items():
         folder_path = os.path.join(base_dir, folder)
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
-            print(f"✅ Created folder: /{folder}")
-        else:
+        try:
+            with os.scandir(folder_path) as entries:
+                existing = {entry.name for entry in entries}
             print(f"ℹ️  Folder exists: /{folder}")
+        except FileNotFoundError:
+            os.makedirs(folder_path, exist_ok=True)
+            existing = set()
+            print(f"✅ Created folder: /{folder}")
         
         for file in files:
-            file_path = os.path.join(folder_path, file)
-            
-            if os.path.exists(file_path):
+            if file in existing:
                 print(f"   ⚠️ File exists (Skipping overwrite): {file}")
                 continue
                 
-            with open(file_path, "w", encoding="utf-8") as f:
-                if file == "README.md":
-                    f.write("# EvoPyramid-Trinity: Formal Coherence Core\n")
-                    f.write("## Audio Manifest: Apashe - Kannibalen\n")
-                    f.write("### Author: Admin Alex (Aleeexzp)\n\n")
-                    f.write("> 'While others build wrappers, we built an Operating System for Cognitive Integrity.'\n\n")
-                    f.write("![Status](https://img.shields.io/badge/Status-COHERENT_1.00-gold)\n")
-                else:
-                    f.write(f"# Trinity Component: {file}\n# Logic Score > 0.3 Verified\n")
+            Path(folder_path, file).write_bytes(SCAFFOLD_BYTES[file])
             print(f"   📄 Generated scaffold: {file}")
 
     print("\n🔥 [SUCCESS] Repository is ready.")
@@ -4,11 +4,32 @@ import random
 import json
 import time
 import os
-from copy import deepcopy
-from collections import defaultdict
+import heapq
+import itertools
+import hashlib
+import pickle
+import zlib
+from collections import defaultdict, deque
+from functools import lru_cache
+from operator import attrgetter
 import asyncio
 from typing import Dict, List, Any, Tuple
 
+# Optional fast JSON backend; stdlib json is used when orjson is absent
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_loads(data):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+def _json_dumps(obj):
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 # ==========================================
 #  MOCK UTILITIES & MISSING CLASSES
@@ -16,6 +37,7 @@ from typing import Dict, List, Any, Tuple
 
 class RealityVisualizer:
     def plot_evolution(self, hall_of_fame):
+        """Accepts any iterable of hall-of-fame entries; it is consumed once"""
         print("[Visualizer] Plotting evolutionary landscape...")
 
 class QualityGate:
@@ -43,89 +65,161 @@ Three pillars of the system:
 # ==========================================
 #  1. Reality Vector
 # ==========================================
+# Initial trait ranges: (name, low, high)
+TRAIT_RANGES = (
+    ("load_bias", 0.5, 1.5),
+    ("security_bias", 0.8, 1.2),
+    ("latency_bias", 0.7, 1.3),
+    ("mutation_rate", 0.01, 0.1),
+    ("memory_pressure", 0.5, 2.0),
+    ("noise_level", 0.05, 0.3)
+)
+TRAIT_NAMES = tuple(name for name, _, _ in TRAIT_RANGES)
+
+def _clone_core(core):
+    """Cheap copy of a core: scalars are shared, only the mutable containers are copied"""
+    clone = dict(core)
+    if 'mutable_params' in core:
+        clone['mutable_params'] = list(core['mutable_params'])
+    if 'traits' in core:
+        clone['traits'] = dict(core['traits'])
+    if 'patterns' in core:
+        clone['patterns'] = list(core['patterns'])
+    return clone
+
+def _clone_cores(cores):
+    return [_clone_core(core) for core in cores]
+
+# Fitness generations kept per reality; bifurcation checks only look at the last one
+HISTORY_LEN = 1024
+
 class RealityVector:
+    __slots__ = ('id', 'traits', 'cores', 'bifurcation_log', 'fitness_score', 'history')
+    
     def __init__(self, base_cores):
         self.id = uuid.uuid4()
-        self.traits = {
-            "load_bias": random.uniform(0.5, 1.5),
-            "security_bias": random.uniform(0.8, 1.2),
-            "latency_bias": random.uniform(0.7, 1.3),
-            "mutation_rate": random.uniform(0.01, 0.1),
-            "memory_pressure": random.uniform(0.5, 2.0),
-            "noise_level": random.uniform(0.05, 0.3)
-        }
-        # Deep copy with mutations
-        self.cores = self._mutate_cores(deepcopy(base_cores))
+        uniform = random.uniform
+        self.traits = {name: uniform(low, high) for name, low, high in TRAIT_RANGES}
+        # Copy with mutations
+        self.cores = self._mutate_cores(_clone_cores(base_cores))
         self.bifurcation_log = []
         self.fitness_score = 0
-        self.history = []
+        self.history = deque(maxlen=HISTORY_LEN)  # Ring buffer of recent fitness scores
+        
+    def _respawn(self, base_cores, traits):
+        """Reuses this slot for a new child reality with the given traits"""
+        self.id = uuid.uuid4()
+        self.traits = traits
+        self.cores = self._mutate_cores(_clone_cores(base_cores))
+        self.bifurcation_log.clear()
+        self.fitness_score = 0
+        self.history.clear()
         
     def _mutate_cores(self, cores):
+        traits = self.traits
+        uniform = random.uniform
         for core in cores:
-            for param in core.get('mutable_params', []):
-                bias = self.traits.get(f"{param}_bias", 1.0)
+            params = core.get('mutable_params', ())
+            biases = [traits.get(param + '_bias', 1.0) for param in params]
+            jitters = [uniform(0.9, 1.1) for _ in params]
+            for param, bias, jitter in zip(params, biases, jitters):
                 if param in core:
-                    core[param] *= bias * random.uniform(0.9, 1.1)
+                    core[param] *= bias * jitter
         return cores
 
 # ==========================================
 #  2. Quantum Reality Protocol
 # ==========================================
+DEFAULT_TELEMETRY_BIASES = {"coherence": 1.0, "latency_bias": 1.0, "security_bias": 1.0}
+
+@lru_cache(maxsize=4)
+def _read_telemetry_biases(path, mtime):
+    """Extracts evolution biases from a saved report; keyed by mtime so edits invalidate it"""
+    biases = dict(DEFAULT_TELEMETRY_BIASES)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.endswith('.zlib'):
+        raw = zlib.decompress(raw)  # Autosave blobs from save_state_binary
+    data = _json_loads(raw)
+    # Extract metrics from the FormalResonanceEngine report structure
+    engine_data = data.get("engine", {})
+    biases["coherence"] = engine_data.get("coherence", {}).get("average", 1.0)
+    
+    monitoring = engine_data.get("monitoring", {})
+    perf = monitoring.get("performance", {})
+    avg_lat = perf.get("avg_processing_time", 0.002)
+    # Normalize latency bias: lower is better, centered around 2ms
+    biases["latency_bias"] = max(0.5, min(1.5, avg_lat / 0.002))
+    
+    threats = engine_data.get("threats", {})
+    if threats.get("level") != "LOW":
+        biases["security_bias"] = 1.2
+    return biases
+
 class QuantumRealityProtocol:
-    def __init__(self, base_cores, num_realities=10):
+    def __init__(self, base_cores, num_realities=10, log_bifurcations: bool = False):
         self.base_cores = base_cores
+        self.log_bifurcations = log_bifurcations  # Registry and fitness history are only kept when enabled
         self.realities = [RealityVector(base_cores) for _ in range(num_realities)]
         self.bifurcation_registry = []
+        self.snapshot_store = {}  # state hash -> zlib-compressed pickled cores, shared by all bifurcations
+        self._pending_snapshots = []  # (bifurcation, cores) awaiting compression
         
     def run_evolution_cycle(self, generations=5):
+        # Telemetry depends on on-disk state only, so it is read once per cycle
+        biases = self._load_real_telemetry()
         for gen in range(generations):
-            for reality in self.realities:
-                self._run_tests(reality)
-                self._log_bifurcations(reality, gen)
+            self._evaluate_population(biases)
+            if self.log_bifurcations:
+                for reality in self.realities:
+                    self._log_bifurcations(reality, gen)
             
-            # Natural Selection
-            self.realities.sort(key=lambda r: r.fitness_score, reverse=True)
-            self._crossover_realities()
+            # Natural Selection: only the top half survives, so no full sort is needed
+            mid = len(self.realities) // 2
+            top = heapq.nlargest(mid, self.realities, key=attrgetter('fitness_score'))
+            self._crossover_realities(top)
             
+        self._flush_snapshots()
         return self._extract_optimal_traits()
     
-    def _run_tests(self, reality):
-        """Multidimensional testing with focus on various aspects"""
-        # Attempt to load real telemetry to bias the scores
-        biases = self._load_real_telemetry()
+    def _evaluate_population(self, biases):
+        """Multidimensional testing of the whole generation with focus on various aspects"""
+        # Real telemetry biases the scores
+        stability_scale = biases.get("coherence", 1.0)
+        efficiency_scale = 2.0 - biases.get("latency_bias", 1.0)
+        security_scale = biases.get("security_bias", 1.0)
         
-        scores = {
-            "stability": self._test_black_swan(reality.cores) * biases.get("coherence", 1.0),
-            "adaptability": self._test_changing_env(reality.cores),
-            "efficiency": self._test_entropy_optimization(reality.cores) * (2.0 - biases.get("latency_bias", 1.0)),
-            "security": self._test_quantum_threats(reality.cores) * biases.get("security_bias", 1.0)
-        }
-        reality.fitness_score = self._calculate_meta_fitness(scores)
+        # Each test scores the whole population at once: one batch of draws per generation
+        population = [reality.cores for reality in self.realities]
+        columns = zip(
+            self._test_black_swan(population),
+            self._test_changing_env(population),
+            self._test_entropy_optimization(population),
+            self._test_quantum_threats(population)
+        )
+        for reality, (stability, adaptability, efficiency, security) in zip(self.realities, columns):
+            scores = (
+                stability * stability_scale,
+                adaptability,
+                efficiency * efficiency_scale,
+                security * security_scale
+            )
+            reality.fitness_score = self._calculate_meta_fitness(scores)
         
     def _load_real_telemetry(self) -> Dict[str, float]:
         """Loads latest report to guide evolution"""
-        biases = {"coherence": 1.0, "latency_bias": 1.0, "security_bias": 1.0}
         try:
-            reports = sorted([f for f in os.listdir('.') if f.startswith('trinity_state_') and f.endswith('.json')])
-            if reports:
-                with open(reports[-1], 'r') as f:
-                    data = json.load(f)
-                    # Extract metrics from the FormalResonanceEngine report structure
-                    engine_data = data.get("engine", {})
-                    biases["coherence"] = engine_data.get("coherence", {}).get("average", 1.0)
-                    
-                    monitoring = engine_data.get("monitoring", {})
-                    perf = monitoring.get("performance", {})
-                    avg_lat = perf.get("avg_processing_time", 0.002)
-                    # Normalize latency bias: lower is better, centered around 2ms
-                    biases["latency_bias"] = max(0.5, min(1.5, avg_lat / 0.002))
-                    
-                    threats = engine_data.get("threats", {})
-                    if threats.get("level") != "LOW":
-                        biases["security_bias"] = 1.2
+            # Only the latest report (plain or compressed autosave) is needed, so take the max in one pass
+            with os.scandir('.') as entries:
+                latest = max((e.name for e in entries
+                              if e.name.startswith('trinity_state_') and e.name.endswith(('.json', '.json.zlib'))),
+                             default=None)
+            if latest:
+                # Re-parsed only when the latest report changes on disk
+                return dict(_read_telemetry_biases(latest, os.path.getmtime(latest)))
         except Exception:
             pass
-        return biases
+        return dict(DEFAULT_TELEMETRY_BIASES)
         
     def _log_bifurcations(self, reality, generation):
         """Logging divergence points"""
@@ -136,25 +230,29 @@ class QuantumRealityProtocol:
                     "gen": generation,
                     "vector": reality.traits.copy(),
                     "delta": reality.fitness_score - prev_score,
-                    "cores_snapshot": self._compress_state(reality.cores)
+                    "cores_snapshot": None  # Filled in by _flush_snapshots
                 }
+                # Cores lists are replaced, never mutated, once assigned, so a reference is safe to defer
+                self._pending_snapshots.append((bifurcation, reality.cores))
                 reality.bifurcation_log.append(bifurcation)
                 self.bifurcation_registry.append(bifurcation)
         reality.history.append(reality.fitness_score)
 
-    def _crossover_realities(self):
-        # Basic crossover: keep top 50%, replace bottom 50% with mutated top
-        mid = len(self.realities) // 2
-        top = self.realities[:mid]
-        for i in range(mid, len(self.realities)):
-            parent = random.choice(top)
-            # Create a clone with slight mutation
-            child = RealityVector(self.base_cores)
-            child.traits = parent.traits.copy()
-            # Mutate one trait
-            trait_to_mutate = random.choice(list(child.traits.keys()))
-            child.traits[trait_to_mutate] *= random.uniform(0.9, 1.1)
-            self.realities[i] = child
+    def _crossover_realities(self, top):
+        # Basic crossover: keep top 50% (best first), reuse bottom 50% slots for mutated top
+        survivors = {id(reality) for reality in top}
+        recycled = [reality for reality in self.realities if id(reality) not in survivors]
+        # Draw every parent, mutated trait and factor for this generation up front
+        count = len(recycled)
+        parents = random.choices(top, k=count)
+        traits_to_mutate = random.choices(TRAIT_NAMES, k=count)
+        factors = [random.uniform(0.9, 1.1) for _ in range(count)]
+        for child, parent, trait_to_mutate, factor in zip(recycled, parents, traits_to_mutate, factors):
+            # Clone with slight mutation: mutate one trait
+            traits = parent.traits.copy()
+            traits[trait_to_mutate] *= factor
+            child._respawn(self.base_cores, traits)
+        self.realities = top + recycled
 
     def _extract_optimal_traits(self):
         if self.realities:
@@ -162,16 +260,40 @@ class QuantumRealityProtocol:
         return {}
 
     # Mocked helper methods
-    def _test_black_swan(self, cores): return random.uniform(0.5, 1.0)
-    def _test_changing_env(self, cores): return random.uniform(0.5, 1.0)
-    def _test_entropy_optimization(self, cores): return random.uniform(0.5, 1.0)
-    def _test_quantum_threats(self, cores): return random.uniform(0.5, 1.0)
+    def _mock_scores(self, population):
+        rand = random.random
+        return [0.5 + 0.5 * rand() for _ in population]
+
+    def _test_black_swan(self, population): return self._mock_scores(population)
+    def _test_changing_env(self, population): return self._mock_scores(population)
+    def _test_entropy_optimization(self, population): return self._mock_scores(population)
+    def _test_quantum_threats(self, population): return self._mock_scores(population)
     
     def _calculate_meta_fitness(self, scores):
-        return sum(scores.values()) / len(scores)
+        return sum(scores) / len(scores)
+
+    def _flush_snapshots(self):
+        """Compresses deferred snapshots in one pass; survivors logged repeatedly are pickled once"""
+        hashes_by_id = {}
+        for bifurcation, cores in self._pending_snapshots:
+            state_hash = hashes_by_id.get(id(cores))
+            if state_hash is None:
+                state_hash = hashes_by_id[id(cores)] = self._compress_state(cores)
+            bifurcation["cores_snapshot"] = state_hash
+        self._pending_snapshots.clear()
 
     def _compress_state(self, cores):
-        return str(cores)
+        """Content-addressed snapshot: identical core states share one compressed blob"""
+        payload = pickle.dumps(cores, pickle.HIGHEST_PROTOCOL)
+        state_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        if state_hash not in self.snapshot_store:
+            # Level 1 favours speed; snapshots are written far more often than read
+            self.snapshot_store[state_hash] = zlib.compress(payload, 1)
+        return state_hash
+
+    def _restore_state(self, state_hash):
+        """Rebuilds an independent copy of the cores saved under a snapshot hash"""
+        return pickle.loads(zlib.decompress(self.snapshot_store[state_hash]))
 
 # ==========================================
 #  3. Trait Recombinator
@@ -187,7 +309,7 @@ class TraitRecombinator:
         beneficial_traits = self._analyze_breakthroughs()
         
         # [ENG] [ENG] [ENG]-[ENG]
-        hybrid_core = deepcopy(self.base_cores[0])
+        hybrid_core = _clone_core(self.base_cores[0])
         
         for trait, value in beneficial_traits.items():
             if trait.endswith('_bias'):
@@ -203,24 +325,28 @@ class TraitRecombinator:
     
     def _analyze_breakthroughs(self):
         """Identifying traits that yielded maximum efficiency jump"""
-        trait_impact = defaultdict(list)
+        # Running per-trait columns: sum(value * impact), sum(impact), first value seen
+        weighted_sums = defaultdict(float)
+        impact_sums = defaultdict(float)
+        first_values = {}
         
         for bifurcation in self.registry:
-            for trait, value in bifurcation['vector'].items():
-                impact = bifurcation['delta'] / len(bifurcation['vector'])
-                trait_impact[trait].append((value, impact))
+            vector = bifurcation['vector']
+            impact = bifurcation['delta'] / len(vector)
+            for trait, value in vector.items():
+                weighted_sums[trait] += value * impact
+                impact_sums[trait] += impact
+                first_values.setdefault(trait, value)
         
         # Selecting trait values with highest positive impact
         optimal_traits = {}
-        for trait, impacts in trait_impact.items():
-            if impacts:
-                # Weighted average by impact
-                total_impact = sum(i for _, i in impacts)
-                if total_impact != 0:
-                     weighted = sum(v * i for v, i in impacts) / total_impact
-                     optimal_traits[trait] = weighted
-                else:
-                    optimal_traits[trait] = impacts[0][0]
+        for trait, first_value in first_values.items():
+            # Weighted average by impact
+            total_impact = impact_sums[trait]
+            if total_impact != 0:
+                optimal_traits[trait] = weighted_sums[trait] / total_impact
+            else:
+                optimal_traits[trait] = first_value
                 
         return optimal_traits
 
@@ -233,15 +359,18 @@ class TraitRecombinator:
 # ==========================================
 #  4. Evolutionary Sandbox
 # ==========================================
+HALL_OF_FAME_SIZE = 5
+
 class EvolutionarySandbox:
     def __init__(self):
         self.generation = 0
-        self.hall_of_fame = []  # Best configurations of all time
+        self._hall_heap = []  # Min-heap of (score, -seq, entry): best configurations of all time
+        self._hall_seq = itertools.count()
         self.genetic_memory = {}  # Patterns that survived crises
         
     def evolutionary_cycle(self, cores, iterations=10):
         for i in range(iterations):
-            protocol = QuantumRealityProtocol(cores)
+            protocol = QuantumRealityProtocol(cores, log_bifurcations=True)  # Lessons are mined from the registry
             results = protocol.run_evolution_cycle() # Returns traits
             
             # Save successful configurations
@@ -287,9 +416,22 @@ class EvolutionarySandbox:
             "score": reality.fitness_score,
             "traits": reality.traits
         }
-        self.hall_of_fame.append(entry)
-        self.hall_of_fame.sort(key=lambda x: x['score'], reverse=True)
-        self.hall_of_fame = self.hall_of_fame[:5]
+        # Bounded heap: the weakest (latest on ties) of the top 5 sits at the root and is evicted first
+        item = (entry["score"], -next(self._hall_seq), entry)
+        if len(self._hall_heap) < HALL_OF_FAME_SIZE:
+            heapq.heappush(self._hall_heap, item)
+        else:
+            heapq.heappushpop(self._hall_heap, item)
+
+    def iter_hall_of_fame(self):
+        """Lazily yields best configurations of all time, highest score first"""
+        for _, _, entry in sorted(self._hall_heap, reverse=True):
+            yield entry
+
+    @property
+    def hall_of_fame(self):
+        """Best configurations of all time, highest score first"""
+        return list(self.iter_hall_of_fame())
 
     def _analyze_recovery(self, bifurcation):
         return "Recovery Strategy X"
@@ -342,18 +484,18 @@ class MultiverseConsole:
         print(f"\n✅ Evolution complete")
         print(f"Best configuration:")
         if 'traits' in new_cores[0]:
-             print(json.dumps(new_cores[0]['traits'], indent=2))
+             print(_json_dumps(new_cores[0]['traits']))
         else:
              print("No traits evolved yet.")
         
-        self.visualizer.plot_evolution(self.sandbox.hall_of_fame)
+        self.visualizer.plot_evolution(self.sandbox.iter_hall_of_fame())
 
     def _create_base_core(self):
         return create_initial_core()
     
     def _explore_bifurcation(self): print("Exploring bifurcation... [Mock]")
     def _create_chimera(self): print("Creating chimera... [Mock]")
-    def _view_genetic_memory(self): print(f"Memory: {json.dumps(self.sandbox.genetic_memory, indent=2)}")
+    def _view_genetic_memory(self): print(f"Memory: {_json_dumps(self.sandbox.genetic_memory)}")
     def _quantum_leap(self): print("Initiating Quantum Leap... [Mock]")
 
 # ==========================================
@@ -14,21 +14,122 @@ import sys
 import asyncio
 import hashlib
 import inspect
+import math
 import textwrap
+import threading
 import time
 import random
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from itertools import count, islice
+from dataclasses import dataclass, field, asdict, is_dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple, Any, Set, Callable
+from typing import Dict, List, Optional, Tuple, Any, Set, FrozenSet, Callable
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 import pickle
 import zlib
 import base64
 
+# Optional fast JSON backend; stdlib json is used when orjson is absent
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes with the fastest available backend"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _is_valid_json(text: str) -> bool:
+    """JSON validity probe; the parsed value is discarded"""
+    try:
+        _json_loads(text)
+    except (ValueError, RecursionError):  # orjson.JSONDecodeError is a ValueError
+        return False
+    return True
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for datetimes, enums and dataclasses in reports"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.name
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _to_json_plain(obj: Any) -> Any:
+    """Apply _json_default ahead of encoding, keys included.
+
+    orjson encodes enums, datetimes and dataclasses natively and never calls
+    default, so converting first makes both backends write the same values.
+    """
+    if isinstance(obj, dict):
+        return {
+            (_json_default(key) if isinstance(key, (Enum, datetime)) else key): _to_json_plain(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_plain(value) for value in obj]
+    if isinstance(obj, (Enum, datetime)) or (is_dataclass(obj) and not isinstance(obj, type)):
+        return _to_json_plain(_json_default(obj))
+    return obj
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes for machine-read state"""
+    obj = _to_json_plain(obj)
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Indented UTF-8 JSON bytes for state and report files"""
+    obj = _to_json_plain(obj)
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _copy_plain(obj: Any) -> Any:
+    """Copy nested dicts and lists of a report; leaves are immutable scalars"""
+    if isinstance(obj, dict):
+        return {key: _copy_plain(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_plain(value) for value in obj]
+    return obj
+
+@contextmanager
+def _atomic_write(filename: str, buffering: int = -1):
+    """Binary file that replaces filename on success; the temp file is removed on any failure"""
+    # Per-thread temp name, so concurrent saves of one file never share a temp file
+    tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_filename, 'wb', buffering=buffering) as f:
+            yield f
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _write_json_file(filename: str, obj: Any):
+    """Atomically replace filename with indented JSON for obj"""
+    with _atomic_write(filename, WRITE_BUFFER_SIZE) as f:
+        f.write(_json_dumps_pretty(obj))
+
 # ==========================================
 #  FORMAL TYPES AND CONSTANTS
 # ==========================================
@@ -81,10 +182,26 @@ class CoherenceLevel(Enum):
     
     @classmethod
     def from_value(cls, value: float) -> 'CoherenceLevel':
-        for level in cls:
-            if level.min <= value < level.max:
-                return level
-        return cls.CRITICAL
+        if not 0.0 <= value <= 1.0:  # Out of range or NaN; a perfect 1.0 is OPTIMAL
+            return cls.CRITICAL
+        return _COHERENCE_LEVELS[bisect_right(_COHERENCE_UPPER_BOUNDS, value)]
+
+# Levels tile [0, 1] in order, so a value's level is found by binary search over upper bounds
+_COHERENCE_LEVELS = tuple(CoherenceLevel)
+_COHERENCE_UPPER_BOUNDS = tuple(level.max for level in _COHERENCE_LEVELS[:-1])
+
+# Valid FSM transitions matrix, shared by every triangle state
+VALID_TRANSITIONS: Dict[TrinityState, FrozenSet[TrinityState]] = {
+    TrinityState.DORMANT: frozenset({TrinityState.LISTENING}),
+    TrinityState.LISTENING: frozenset({TrinityState.PARSING, TrinityState.BLOCKED}),
+    TrinityState.PARSING: frozenset({TrinityState.NORMALIZING, TrinityState.BLOCKED}),
+    TrinityState.NORMALIZING: frozenset({TrinityState.VALIDATING, TrinityState.CORRECTING}),
+    TrinityState.VALIDATING: frozenset({TrinityState.EMITTING, TrinityState.CORRECTING, TrinityState.BLOCKED}),
+    TrinityState.CORRECTING: frozenset({TrinityState.EMITTING, TrinityState.BLOCKED}),
+    TrinityState.EMITTING: frozenset({TrinityState.LISTENING, TrinityState.DORMANT}),
+    TrinityState.BLOCKED: frozenset({TrinityState.RECOVERING}),
+    TrinityState.RECOVERING: frozenset({TrinityState.DORMANT})
+}
 
 # ==========================================
 #  FORMAL DATA CLASSES
@@ -137,10 +254,12 @@ class ValidationResult:
         return CoherenceLevel.from_value(self.final_coherence)
     
     def to_audit_entry(self) -> Dict:
+        timestamp = self.timestamp.isoformat()
         return {
-            "validation_id": hashlib.md5(self.input_hash.encode() + self.timestamp.isoformat().encode()).hexdigest()[:16],
+            # 8-byte digest yields the same 16 hex chars without slicing
+            "validation_id": hashlib.blake2b((self.input_hash + timestamp).encode(), digest_size=8).hexdigest(),
             "triangle": self.triangle.code,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": timestamp,
             "valid": self.is_valid,
             "coherence": self.final_coherence,
             "level": self.coherence_level.name,
@@ -161,9 +280,7 @@ class TriangleState:
     
     def transition(self, new_state: TrinityState) -> bool:
         """Formal state transition with validity check"""
-        valid_transitions = self._get_valid_transitions()
-        
-        if new_state in valid_transitions.get(self.current_state, set()):
+        if new_state in VALID_TRANSITIONS.get(self.current_state, ()):
             self.state_history.append((self.current_state, datetime.now()))
             self.current_state = new_state
             self.last_activity = datetime.now()
@@ -173,19 +290,9 @@ class TriangleState:
             return True
         return False
     
-    def _get_valid_transitions(self) -> Dict[TrinityState, Set[TrinityState]]:
+    def _get_valid_transitions(self) -> Dict[TrinityState, FrozenSet[TrinityState]]:
         """Valid transitions matrix"""
-        return {
-            TrinityState.DORMANT: {TrinityState.LISTENING},
-            TrinityState.LISTENING: {TrinityState.PARSING, TrinityState.BLOCKED},
-            TrinityState.PARSING: {TrinityState.NORMALIZING, TrinityState.BLOCKED},
-            TrinityState.NORMALIZING: {TrinityState.VALIDATING, TrinityState.CORRECTING},
-            TrinityState.VALIDATING: {TrinityState.EMITTING, TrinityState.CORRECTING, TrinityState.BLOCKED},
-            TrinityState.CORRECTING: {TrinityState.EMITTING, TrinityState.BLOCKED},
-            TrinityState.EMITTING: {TrinityState.LISTENING, TrinityState.DORMANT},
-            TrinityState.BLOCKED: {TrinityState.RECOVERING},
-            TrinityState.RECOVERING: {TrinityState.DORMANT}
-        }
+        return VALID_TRANSITIONS
     
     def _update_metrics(self, new_state: TrinityState):
         """Updating metrics during transition"""
@@ -209,16 +316,41 @@ class TriangleState:
 class FormalResonanceEngine:
     """Formal resonance engine with evidence-based architecture"""
     
+    COHERENCE_HISTORY_SIZE = 65536
+    
+    # Emission templates per triangle; only GREEN consumes a data ID
+    EMISSION_FORMATS = {
+        TriangleColor.BLACK: "🖤 {content}",
+        TriangleColor.GOLD: '"{content}"',
+        TriangleColor.RED: "❓ {content}",
+        TriangleColor.GREEN: "#[{data_id}] {content}"
+    }
+    
+    COHERENCE_PREFIXES = {
+        CoherenceLevel.CRITICAL: "[CRITICAL: {:.2f}] ⚡ ",
+        CoherenceLevel.WARNING: "[WARNING: {:.2f}] ⚠️ ",
+        CoherenceLevel.STABLE: "[STABLE: {:.2f}] ✅ ",
+        CoherenceLevel.OPTIMAL: "[OPTIMAL: {:.2f}] ✨ "
+    }
+    
     def __init__(self, admin_name: str = "Admin Alex", version: str = "3.0.0"):
         self.version = version
         self.admin = admin_name
         self.creation_time = datetime.now()
+        self._monotonic_start = time.monotonic()
         self.session_id = self._generate_session_id()
         self.resonance_signature = self._generate_signature()
         self.directive = self._create_directive()
-        self.coherence_history = []
+        # Ring buffer of recent scores; session-wide stats are kept as running totals
+        self.coherence_history = deque(maxlen=self.COHERENCE_HISTORY_SIZE)
+        self._coherence_count = 0
+        self._coherence_sum = 0.0
+        self._coherence_min = 1.0
+        self._coherence_max = 1.0
         self._initialized = False
-        self._lock = asyncio.Lock()
+        self._triangle_locks = {triangle: asyncio.Lock() for triangle in TriangleColor}
+        # Guards state shared across triangles: FSM activation, coherence history, monitor
+        self._shared_lock = asyncio.Lock()
         
         # Subsystems initialization
         self.threat_model = TrinityThreatModel()
@@ -229,6 +361,12 @@ class FormalResonanceEngine:
         
         # Activation
         self._initialize_subsystems()
+        
+        # Keyed by the plain-string code: TriangleColor members hash through Enum's Python-level __hash__
+        self._triangle_states = {
+            state.color.code: state
+            for state in (self.black_core_state, self.gold_state, self.red_state, self.green_state)
+        }
     
     def _generate_session_id(self) -> str:
         """Unique session ID generation"""
@@ -262,33 +400,41 @@ class FormalResonanceEngine:
     
     def _initialize_subsystems(self):
         """Subsystems initialization"""
+        # Banner lines, subsystem messages included, are collected and written once
+        lines = [
+            "=" * 70,
+            f"FORMAL INITIALIZATION OF TRINITY RESONANCE v{self.version}",
+            "=" * 70
+        ]
+        
         init_sequence = [
             ("🖤", "Initializing BLACK CORE", self._init_black_core),
             ("🟨", "Initializing GOLD Trailblazer", self._init_gold),
             ("🟥", "Initializing RED Provocateur", self._init_red),
             ("🟩", "Initializing GREEN Soul", self._init_green),
-            ("⚡", "Initializing security protocol", self.threat_model.initialize),
-            ("📊", "Initializing monitoring", self.monitor.initialize)
+            ("⚡", "Initializing security protocol", lambda: self.threat_model.initialize(lines.append)),
+            ("📊", "Initializing monitoring", lambda: self.monitor.initialize(lines.append))
         ]
         
-        print("=" * 70)
-        print(f"FORMAL INITIALIZATION OF TRINITY RESONANCE v{self.version}")
-        print("=" * 70)
-        
-        for symbol, description, init_func in init_sequence:
-            try:
-                init_func()
-                print(f"{symbol} {description}: SUCCESS")
-            except Exception as e:
-                print(f"{symbol} {description}: ERROR - {str(e)}")
-                raise
-        
-        self._initialized = True
-        print("=" * 70)
-        print(f"✅ SYSTEM ACTIVATED | Session: {self.session_id}")
-        print(f"   Signature: {self.resonance_signature}")
-        print(f"   Administrator: {self.admin}")
-        print("=" * 70)
+        try:
+            for symbol, description, init_func in init_sequence:
+                try:
+                    init_func()
+                    lines.append(f"{symbol} {description}: SUCCESS")
+                except Exception as e:
+                    lines.append(f"{symbol} {description}: ERROR - {str(e)}")
+                    raise
+            
+            self._initialized = True
+            lines += [
+                "=" * 70,
+                f"✅ SYSTEM ACTIVATED | Session: {self.session_id}",
+                f"   Signature: {self.resonance_signature}",
+                f"   Administrator: {self.admin}",
+                "=" * 70
+            ]
+        finally:
+            sys.stdout.write("\n".join(lines) + "\n")
     
     def _init_black_core(self):
         """BLACK CORE initialization"""
@@ -312,21 +458,24 @@ class FormalResonanceEngine:
     
     async def process(self, message: str, triangle_code: str) -> Dict[str, Any]:
         """Formal message processing via selected triangle"""
-        async with self._lock:
-            if not self._initialized:
-                raise RuntimeError("Engine not initialized")
-            
-            if self.directive.is_expired():
-                raise RuntimeError("Directive expired")
-            
-            # Get triangle
-            try:
-                triangle = TriangleColor[triangle_code.upper()]
-            except KeyError:
-                raise ValueError(f"Unknown triangle: {triangle_code}")
-            
+        if not self._initialized:
+            raise RuntimeError("Engine not initialized")
+        
+        if self.directive.is_expired():
+            raise RuntimeError("Directive expired")
+        
+        # Get triangle
+        try:
+            triangle = TriangleColor[triangle_code.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown triangle: {triangle_code}")
+        
+        # Triangle FSMs are independent, so only messages for the same triangle queue up
+        async with self._triangle_locks[triangle]:
             # Activate triangle in FSM
-            if not self.state_machine.activate_triangle(triangle):
+            async with self._shared_lock:
+                activated = self.state_machine.activate_triangle(triangle)
+            if not activated:
                 raise RuntimeError(f"Failed to activate triangle: {triangle.code}")
             
             # Get triangle state
@@ -345,7 +494,7 @@ class FormalResonanceEngine:
                 normalized = await self.normalizer.normalize(parsed, triangle)
                 
                 # Re-parse normalized text for validation
-                parsed_normalized = await self.validator.parse_input(normalized, triangle)
+                parsed_normalized = await self.validator.reparse(parsed, normalized, triangle)
                 
                 # Step 3: Validation
                 triangle_state.transition(TrinityState.VALIDATING)
@@ -360,7 +509,7 @@ class FormalResonanceEngine:
                     corrected = await self.normalizer.correct(normalized, triangle, validation)
                     
                     # Re-parse corrected text for validation
-                    parsed_corrected = await self.validator.parse_input(corrected, triangle)
+                    parsed_corrected = await self.validator.reparse(parsed_normalized, corrected, triangle)
                     
                     validation = await self.validator.validate(parsed_corrected, triangle)
                     
@@ -375,8 +524,9 @@ class FormalResonanceEngine:
                 processing_time = time.time() - start_time
                 
                 # Updating metrics
-                self.coherence_history.append(validation.final_coherence)
-                self.monitor.record_processing(triangle, processing_time, validation)
+                async with self._shared_lock:
+                    self._record_coherence(validation.final_coherence)
+                    self.monitor.record_processing(triangle, processing_time, validation)
                 
                 # Return formal result
                 return {
@@ -394,7 +544,8 @@ class FormalResonanceEngine:
                 
             except Exception as e:
                 triangle_state.transition(TrinityState.BLOCKED)
-                self.monitor.record_error(triangle, str(e))
+                async with self._shared_lock:
+                    self.monitor.record_error(triangle, str(e))
                 
                 return {
                     "status": "error",
@@ -405,29 +556,30 @@ class FormalResonanceEngine:
                     "result": f"🖤 [SYSTEM_ERROR] Processing error: {str(e)}"
                 }
     
+    async def process_batch(self, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Processing (message, triangle_code) pairs in order"""
+        # Reject unknown triangles before anything is processed, not midway through the batch
+        for _, triangle_code in items:
+            if triangle_code.upper() not in TriangleColor.__members__:
+                raise ValueError(f"Unknown triangle: {triangle_code}")
+        
+        # Input order is kept: the FSM treats the order of activations as significant
+        return [await self.process(message, triangle_code) for message, triangle_code in items]
+    
     def _get_triangle_state(self, triangle: TriangleColor) -> TriangleState:
         """Getting triangle state"""
-        states = {
-            TriangleColor.BLACK: self.black_core_state,
-            TriangleColor.GOLD: self.gold_state,
-            TriangleColor.RED: self.red_state,
-            TriangleColor.GREEN: self.green_state
-        }
-        return states[triangle]
+        return self._triangle_states[triangle.code]
     
     def _create_emission(self, content: str, triangle: TriangleColor, validation: ValidationResult) -> str:
         """Creating result emission"""
         prefix = self._get_coherence_prefix(validation.final_coherence)
         
-        formats = {
-            TriangleColor.BLACK: f"🖤 {content}",
-            TriangleColor.GOLD: f'"{content}"',
-            TriangleColor.RED: f"❓ {content}",
-            TriangleColor.GREEN: f"#[{self._generate_data_id()}] {content}"
-        }
+        template = self.EMISSION_FORMATS.get(triangle)
+        if template is None:
+            return f"{prefix}{content}"
         
-        formatted = formats.get(triangle, content)
-        return f"{prefix}{formatted}"
+        data_id = self._generate_data_id() if triangle is TriangleColor.GREEN else None
+        return prefix + template.format(content=content, data_id=data_id)
     
     def _create_blocked_response(self, triangle: TriangleColor, validation: ValidationResult) -> str:
         """Creating blocked response"""
@@ -436,16 +588,8 @@ class FormalResonanceEngine:
     
     def _get_coherence_prefix(self, coherence: float) -> str:
         """Getting coherence prefix"""
-        level = CoherenceLevel.from_value(coherence)
-        
-        prefixes = {
-            CoherenceLevel.CRITICAL: f"[CRITICAL: {coherence:.2f}] ⚡ ",
-            CoherenceLevel.WARNING: f"[WARNING: {coherence:.2f}] ⚠️ ",
-            CoherenceLevel.STABLE: f"[STABLE: {coherence:.2f}] ✅ ",
-            CoherenceLevel.OPTIMAL: f"[OPTIMAL: {coherence:.2f}] ✨ "
-        }
-        
-        return prefixes.get(level, "")
+        template = self.COHERENCE_PREFIXES.get(CoherenceLevel.from_value(coherence))
+        return template.format(coherence) if template else ""
     
     def _generate_data_id(self) -> str:
         """Unique data ID generation"""
@@ -453,6 +597,21 @@ class FormalResonanceEngine:
         random_part = os.urandom(4).hex()
         return f"D{timestamp}_{random_part}"
     
+    def _record_coherence(self, value: float):
+        """Appends a score and updates the running stats in O(1)"""
+        if self._coherence_count:
+            self._coherence_min = min(self._coherence_min, value)
+            self._coherence_max = max(self._coherence_max, value)
+        else:
+            self._coherence_min = self._coherence_max = value
+        self._coherence_count += 1
+        self._coherence_sum += value
+        self.coherence_history.append(value)
+    
+    def get_uptime(self) -> float:
+        """Seconds since engine creation"""
+        return time.monotonic() - self._monotonic_start
+    
     def get_system_status(self) -> Dict:
         """Getting full system status"""
         return {
@@ -461,73 +620,144 @@ class FormalResonanceEngine:
                 "signature": self.resonance_signature,
                 "version": self.version,
                 "admin": self.admin,
-                "uptime": (datetime.now() - self.creation_time).total_seconds(),
+                "uptime": self.get_uptime(),
                 "initialized": self._initialized
             },
             "directive": self.directive.to_dict(),
             "coherence": {
                 "current": self.coherence_history[-1] if self.coherence_history else 1.0,
-                "average": sum(self.coherence_history) / len(self.coherence_history) if self.coherence_history else 1.0,
-                "min": min(self.coherence_history) if self.coherence_history else 1.0,
-                "max": max(self.coherence_history) if self.coherence_history else 1.0,
-                "history_size": len(self.coherence_history)
+                "average": self._coherence_sum / self._coherence_count if self._coherence_count else 1.0,
+                "min": self._coherence_min,
+                "max": self._coherence_max,
+                "history_size": self._coherence_count
             },
             "triangles": {
-                triangle.code: {
-                    "state": self._get_triangle_state(triangle).current_state.name,
-                    "coherence": self._get_triangle_state(triangle).coherence_score,
-                    "violations": self._get_triangle_state(triangle).violation_count,
-                    "corrections": self._get_triangle_state(triangle).correction_count,
-                    "active_for": self._get_triangle_state(triangle).get_state_duration()
+                state.color.code: {
+                    "state": state.current_state.name,
+                    "coherence": state.coherence_score,
+                    "violations": state.violation_count,
+                    "corrections": state.correction_count,
+                    "active_for": state.get_state_duration()
                 }
-                for triangle in TriangleColor
+                for state in map(self._get_triangle_state, TriangleColor)
             },
             "threats": self.threat_model.get_current_threat_level(),
-            "monitoring": self.monitor.get_summary()
+            "monitoring": self.monitor.get_summary(),
+            "parse_cache": self.validator.cache_info()
         }
 
 # ==========================================
 #  FORMAL VALIDATOR
 # ==========================================
 
+# Validation patterns are compiled once and shared by every validator instance
+VALIDATOR_PATTERNS: Dict[str, re.Pattern] = {
+    "gold_logic": re.compile(r'\b(?:if|then|else|for|while|return|function|algorithm|O\([^)]+\)|optimize|analyze|calculate)\b', re.IGNORECASE),
+    "gold_action": re.compile(r'\b(?:synthesize|optimize|calculate|compare|analyze|design)\b', re.IGNORECASE),
+    "red_question": re.compile(r'^(❓|\?|why|how|what|where|when|who)\s*', re.IGNORECASE),
+    "green_json": re.compile(r'^#\[[^\]]+\]\s*\{.*\}', re.DOTALL),
+    "injection": re.compile(r'--|\b(?:DROP|DELETE|INSERT|UPDATE|SELECT|UNION|EXEC|SYSTEM|OS|SUBPROCESS)\b', re.IGNORECASE)
+}
+
+PROVOCATIVE_RE = re.compile(r'\b(?:why|what\s+for|doubt|criticism|problem)\b')
+
+# All GOLD features in one scan. Zero-width lookahead keeps every position
+# available to every feature; overlapping alternatives get their own group
+# (shared gold_logic/gold_action words, metrics that are also numeric data).
+GOLD_FEATURES_RE = re.compile(
+    r'(?=(?P<logic_action>(?i:\b(?:optimize|analyze|calculate)\b))'
+    r'|(?P<logic>(?i:\b(?:if|then|else|for|while|return|function|algorithm|O\([^)]+\))\b))'
+    r'|(?P<action>(?i:\b(?:synthesize|compare|design)\b))'
+    r'|(?P<numeric_metrics>\d+%|\d+\.\d+)'
+    r'|(?P<metrics>\b(?:increase|decrease|efficiency)\b)'
+    r'|(?P<numeric>\d)'
+    r'|(?P<comparison>\b(?:than|against|compared|better|worse)\b))'
+)
+GOLD_FEATURE_IMPLIES = {
+    "logic_action": ("logic", "action"),
+    "numeric_metrics": ("numeric", "metrics")
+}
+
+# Question categories in priority order; one scan collects every category present
+QUESTION_TYPES = ("CAUSAL", "METHOD", "DEFINITION", "TEMPORAL", "LOCATIONAL")
+QUESTION_TYPE_BITS = {question_type: 1 << rank for rank, question_type in enumerate(QUESTION_TYPES)}
+QUESTION_TYPE_RE = re.compile(
+    r'\b(?:(?P<CAUSAL>why|reason)|(?P<METHOD>how|method|way)|(?P<DEFINITION>what|definition|essence)'
+    r'|(?P<TEMPORAL>when|time|deadline)|(?P<LOCATIONAL>where|location))\b'
+)
+
+DEEP_QUESTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(why|reason|root|original)\b',
+    r'\b(hypothesis|assumption|alternative)\b',
+    r'[?]{2,}',  # Multiple questions
+    r'\b(if\s+.*\s+then\s*)\?',
+    r'\b(consequence|result|outcome)\b'
+))
+
+# Any one hit marks a HIGH implication, so the alternatives share a single pattern
+SECURITY_RISK_RE = re.compile(
+    r'\b(password|key|token|secret|access)\b'
+    r'|\b(delete|erase|clear|reset)\b'
+    r'|\b(system|core|architecture|security)\s+.*\s+(change|modify)\b',
+    re.IGNORECASE
+)
+
+# violations, corrections, form/semantic/arch coherence, explainability trace
+ValidatorOutcome = Tuple[List[str], List[str], float, float, float, List[str]]
+
 class FormalValidator:
     """Formal validator with multi-level check"""
     
+    PARSE_CACHE_SIZE = 4096
+    
     def __init__(self, engine: FormalResonanceEngine):
         self.engine = engine
-        self.cache = {}
-        self.patterns = self._initialize_patterns()
+        # LRU keyed by the text itself: str caches its own hash, so hits cost no hashing
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.patterns = VALIDATOR_PATTERNS
+        self._validators: Dict[TriangleColor, Callable[[Dict], ValidatorOutcome]] = {
+            TriangleColor.GOLD: self._validate_gold,
+            TriangleColor.RED: self._validate_red,
+            TriangleColor.GREEN: self._validate_green,
+            TriangleColor.BLACK: self._validate_black
+        }
     
-    def _initialize_patterns(self) -> Dict[str, re.Pattern]:
-        """Validation patterns initialization"""
+    def cache_info(self) -> Dict[str, int]:
+        """Parse cache statistics"""
         return {
-            "gold_logic": re.compile(r'\b(?:if|then|else|for|while|return|function|algorithm|O\([^)]+\)|optimize|analyze|calculate)\b', re.IGNORECASE),
-            "gold_action": re.compile(r'\b(?:synthesize|optimize|calculate|compare|analyze|design)\b', re.IGNORECASE),
-            "red_question": re.compile(r'^(❓|\?|why|how|what|where|when|who)\s*', re.IGNORECASE),
-            "green_json": re.compile(r'^#\[[^\]]+\]\s*\{.*\}', re.DOTALL),
-            "injection": re.compile(r'--|\b(?:DROP|DELETE|INSERT|UPDATE|SELECT|UNION|EXEC|SYSTEM|OS|SUBPROCESS)\b', re.IGNORECASE)
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self.cache),
+            "max_size": self.PARSE_CACHE_SIZE
         }
     
     async def parse_input(self, text: str, triangle: TriangleColor) -> Dict[str, Any]:
         """Input syntax parsing"""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        cached = self.cache.get(text)
+        if cached is not None:
+            self.cache.move_to_end(text)
+            self.cache_hits += 1
+            return cached
+        self.cache_misses += 1
         
-        if text_hash in self.cache:
-            return self.cache[text_hash]
+        # Content ID for audit entries, only computed on a cache miss
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
         
         parsed = {
             "raw": text,
             "hash": text_hash,
             "length": len(text),
             "word_count": len(text.split()),
-            "has_unicode": any(ord(c) > 127 for c in text),
+            "has_unicode": not text.isascii(),
             "triangle": triangle.code,
-            "timestamp": datetime.now().isoformat()
+            "ts_ns": time.time_ns()  # Formatted only if ever serialized
         }
         
         # Triangle-specific parsing
         if triangle == TriangleColor.GOLD:
-            parsed.update(self._parse_gold(text))
+            parsed.update(self._parse_gold(text, parsed["word_count"]))
         elif triangle == TriangleColor.RED:
             parsed.update(self._parse_red(text))
         elif triangle == TriangleColor.GREEN:
@@ -535,31 +765,85 @@ class FormalValidator:
         elif triangle == TriangleColor.BLACK:
             parsed.update(self._parse_black(text))
         
-        self.cache[text_hash] = parsed
+        self._cache_store(text, parsed)
         return parsed
     
-    def _parse_gold(self, text: str) -> Dict:
+    async def reparse(self, parsed: Dict[str, Any], text: str, triangle: TriangleColor) -> Dict[str, Any]:
+        """Parsing text produced from an already parsed input by normalization or correction"""
+        raw = parsed["raw"]
+        if text == raw:
+            return parsed
+        
+        if (triangle == TriangleColor.GOLD and parsed["triangle"] == triangle.code
+                and text not in self.cache and self._is_quote_wrap(raw, text)):
+            # Wrapping in quotes only flips has_quotes: the outer quotes add no words,
+            # structure markers or word boundaries that other GOLD features depend on.
+            # The cache is keyed by text alone, so parsed may carry another triangle's features
+            self.cache_misses += 1
+            derived = dict(
+                parsed,
+                raw=text,
+                hash=hashlib.blake2b(text.encode(), digest_size=16).hexdigest(),
+                length=len(text),
+                ts_ns=time.time_ns(),
+                has_quotes=True
+            )
+            self._cache_store(text, derived)
+            return derived
+        
+        return await self.parse_input(text, triangle)
+    
+    @staticmethod
+    def _is_quote_wrap(raw: str, text: str) -> bool:
+        """True if text is raw wrapped in quotes with no whitespace at the seams"""
+        return (
+            len(text) == len(raw) + 2
+            and raw[:1].strip() != "" and raw[-1:].strip() != ""
+            and text[0] == '"' and text[-1] == '"'
+            and text[1:-1] == raw
+        )
+    
+    def _cache_store(self, text: str, parsed: Dict[str, Any]):
+        """Adds a parse result, evicting the least recently used entry when full"""
+        self.cache[text] = parsed
+        if len(self.cache) > self.PARSE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+    
+    def _parse_gold(self, text: str, word_count: int) -> Dict:
         """Parsing GOLD input"""
+        # One regex pass and the shared word count feed every GOLD feature
+        features = self._scan_gold_features(text)
         return {
             "has_quotes": text.startswith('"') and text.endswith('"'),
-            "logic_score": self._calculate_logic_score(text),
-            "has_metrics": bool(re.search(r'\d+%|\d+\.\d+|\b(?:increase|decrease|efficiency)\b', text)),
-            "structure_quality": self._assess_structure(text)
+            "logic_score": self._calculate_logic_score(text, features, word_count),
+            "has_metrics": "metrics" in features,
+            "structure_quality": self._assess_structure(text, word_count)
         }
     
+    def _scan_gold_features(self, text: str) -> Set[str]:
+        """Single-pass GOLD feature scan"""
+        features = set()
+        for match in GOLD_FEATURES_RE.finditer(text):
+            features.add(match.lastgroup)
+        for combined, implied in GOLD_FEATURE_IMPLIES.items():
+            if combined in features:
+                features.update(implied)
+        return features
+    
     def _parse_red(self, text: str) -> Dict:
         """Parsing RED input"""
         return {
             "is_question": text.strip().endswith('?') or text.startswith('❓'),
             "question_type": self._classify_question(text),
-            "has_provocative": bool(re.search(r'\b(?:why|what\s+for|doubt|criticism|problem)\b', text)),
+            "has_provocative": bool(PROVOCATIVE_RE.search(text)),
             "depth_score": self._calculate_question_depth(text)
         }
     
     def _parse_green(self, text: str) -> Dict:
         """Parsing GREEN input"""
+        tag_start = text.find("#[")
         return {
-            "has_json_tag": "#[" in text and "]" in text.split("#[", 1)[1],
+            "has_json_tag": tag_start >= 0 and text.find("]", tag_start + 2) >= 0,
             "json_valid": self._validate_json_structure(text),
             "data_density": len(text) / max(text.count('{') + text.count('['), 1),
             "security_risk": bool(self.patterns["injection"].search(text))
@@ -573,119 +857,81 @@ class FormalValidator:
             "security_implication": self._assess_security_implication(text)
         }
     
-    def _calculate_logic_score(self, text: str) -> float:
+    def _calculate_logic_score(self, text: str, features: Set[str], word_count: int) -> float:
         """Text logic value assessment"""
         score = 0.0
         
         # Logic pattern check
-        if self.patterns["gold_logic"].search(text):
+        if "logic" in features:
             score += 0.3
         
         # Action verbs check
-        if self.patterns["gold_action"].search(text):
+        if "action" in features:
             score += 0.3
         
         # Structure check
-        if len(text.split()) > 3 and any(c in text for c in ['.', ';', ',', ':']):
+        if word_count > 3 and any(c in text for c in ['.', ';', ',', ':']):
             score += 0.2
         
         # Numeric data check
-        if re.search(r'\d+', text):
+        if "numeric" in features:
             score += 0.1
         
         # Comparisons check
-        if re.search(r'\b(?:than|against|compared|better|worse)\b', text):
+        if "comparison" in features:
             score += 0.1
         
         return min(1.0, score)
     
     def _classify_question(self, text: str) -> str:
         """Question type classification"""
-        text_lower = text.lower()
+        hits = 0
+        for match in QUESTION_TYPE_RE.finditer(text.lower()):
+            hits |= QUESTION_TYPE_BITS[match.lastgroup]
+            if hits & 1:
+                break  # CAUSAL has the highest priority, no need to scan further
         
-        if re.search(r'\b(?:why|reason)\b', text_lower):
-            return "CAUSAL"
-        elif re.search(r'\b(?:how|method|way)\b', text_lower):
-            return "METHOD"
-        elif re.search(r'\b(?:what|definition|essence)\b', text_lower):
-            return "DEFINITION"
-        elif re.search(r'\b(?:when|time|deadline)\b', text_lower):
-            return "TEMPORAL"
-        elif re.search(r'\b(?:where|location)\b', text_lower):
-            return "LOCATIONAL"
-        else:
-            return "GENERIC"
+        # Lowest set bit is the highest-priority category found
+        return QUESTION_TYPES[(hits & -hits).bit_length() - 1] if hits else "GENERIC"
     
     def _validate_json_structure(self, text: str) -> bool:
         """JSON structure validation"""
-        try:
-            # Extract JSON part
-            if "#[" in text:
-                json_part = text.split("]", 1)[1].strip()
-                json.loads(json_part)
-                return True
-        except:
-            pass
+        # Extract JSON part
+        if "#[" in text:
+            _, bracket, json_part = text.partition("]")
+            if bracket:
+                return _is_valid_json(json_part.strip())
         return False
     
     async def validate(self, parsed: Dict, triangle: TriangleColor) -> ValidationResult:
         """Formal validation with multi-level assessment"""
-        input_hash = parsed["hash"]
-        
-        # [ENG] [ENG]
-        form_coherence = 1.0
-        semantic_coherence = 1.0
-        arch_coherence = 1.0
-        violations = []
-        corrections = []
-        transformations = []
-        explainability = []
-        
-        # Validation by triangle
-        if triangle == TriangleColor.GOLD:
-            result = self._validate_gold(parsed)
-        elif triangle == TriangleColor.RED:
-            result = self._validate_red(parsed)
-        elif triangle == TriangleColor.GREEN:
-            result = self._validate_green(parsed)
-        elif triangle == TriangleColor.BLACK:
-            result = self._validate_black(parsed)
+        check = self._validators.get(triangle)
+        if check is not None:
+            violations, corrections, form_coherence, semantic_coherence, arch_coherence, explainability = check(parsed)
         else:
-            result = {"valid": False, "violations": ["Unknown triangle"]}
-        
-        # Extracting results
-        violations = result.get("violations", [])
-        corrections = result.get("corrections", [])
-        transformations = result.get("transformations", [])
-        form_coherence = result.get("form_coherence", 1.0)
-        semantic_coherence = result.get("semantic_coherence", 1.0)
-        arch_coherence = result.get("arch_coherence", 1.0)
-        explainability = result.get("explainability", [])
-        
-        # Calculating final coherence
-        weights = (0.4, 0.4, 0.2)  # form, semantics, architecture
-        final_coherence = (
-            form_coherence * weights[0] +
-            semantic_coherence * weights[1] + 
-            arch_coherence * weights[2]
-        )
+            violations, corrections, explainability = ["Unknown triangle"], [], []
+            form_coherence = semantic_coherence = arch_coherence = 1.0
         
-        is_valid = len(violations) == 0
+        # Calculating final coherence (weights: form 0.4, semantics 0.4, architecture 0.2)
+        final_coherence = form_coherence * 0.4 + semantic_coherence * 0.4 + arch_coherence * 0.2
         
         return ValidationResult(
-            is_valid=is_valid,
-            input_hash=input_hash,
+            is_valid=not violations,
+            input_hash=parsed["hash"],
             triangle=triangle,
             timestamp=datetime.now(),
             coherence_vector=(form_coherence, semantic_coherence, arch_coherence),
             violations=violations,
             corrections=corrections,
-            transformations=transformations,
+            transformations=[],
             final_coherence=final_coherence,
             explainability_trace=explainability
         )
     
-    def _validate_gold(self, parsed: Dict) -> Dict:
+    # Each triangle validator returns
+    # (violations, corrections, form_coherence, semantic_coherence, arch_coherence, explainability)
+    
+    def _validate_gold(self, parsed: Dict) -> ValidatorOutcome:
         """Validating GOLD triangle"""
         violations = []
         corrections = []
@@ -693,7 +939,6 @@ class FormalValidator:
         
         form_coherence = 1.0
         semantic_coherence = parsed.get("logic_score", 0.0)
-        arch_coherence = 1.0
         
         # Form check (quotes)
         if not parsed.get("has_quotes", False):
@@ -712,25 +957,15 @@ class FormalValidator:
         if parsed.get("has_metrics", False):
             explainability.append("Numerical metrics detected")
         
-        return {
-            "valid": len(violations) == 0,
-            "violations": violations,
-            "corrections": corrections,
-            "form_coherence": form_coherence,
-            "semantic_coherence": semantic_coherence,
-            "arch_coherence": arch_coherence,
-            "explainability": explainability
-        }
+        return violations, corrections, form_coherence, semantic_coherence, 1.0, explainability
     
-    def _validate_red(self, parsed: Dict) -> Dict:
+    def _validate_red(self, parsed: Dict) -> ValidatorOutcome:
         """Validating RED triangle"""
         violations = []
         corrections = []
-        explainability = []
         
         form_coherence = 1.0
         semantic_coherence = parsed.get("depth_score", 1.0)
-        arch_coherence = 1.0
         
         # Form check (question)
         if not parsed.get("is_question", False):
@@ -749,20 +984,11 @@ class FormalValidator:
         if not parsed.get("has_provocative", False):
             semantic_coherence *= 0.8
         
-        explainability.append(f"Question type: {question_type}")
-        explainability.append(f"Depth score: {semantic_coherence:.2f}")
+        explainability = [f"Question type: {question_type}", f"Depth score: {semantic_coherence:.2f}"]
         
-        return {
-            "valid": len(violations) == 0,
-            "violations": violations,
-            "corrections": corrections,
-            "form_coherence": form_coherence,
-            "semantic_coherence": semantic_coherence,
-            "arch_coherence": arch_coherence,
-            "explainability": explainability
-        }
+        return violations, corrections, form_coherence, semantic_coherence, 1.0, explainability
     
-    def _validate_green(self, parsed: Dict) -> Dict:
+    def _validate_green(self, parsed: Dict) -> ValidatorOutcome:
         """Validating GREEN triangle"""
         violations = []
         corrections = []
@@ -798,17 +1024,9 @@ class FormalValidator:
         
         explainability.append(f"Data density: {data_density:.1f} chars/structure")
         
-        return {
-            "valid": len(violations) == 0,
-            "violations": violations,
-            "corrections": corrections,
-            "form_coherence": form_coherence,
-            "semantic_coherence": semantic_coherence,
-            "arch_coherence": arch_coherence,
-            "explainability": explainability
-        }
+        return violations, corrections, form_coherence, semantic_coherence, arch_coherence, explainability
     
-    def _validate_black(self, parsed: Dict) -> Dict:
+    def _validate_black(self, parsed: Dict) -> ValidatorOutcome:
         """Validating BLACK triangle"""
         # BLACK CORE is always valid, but monitors
         explainability = []
@@ -821,45 +1039,28 @@ class FormalValidator:
         if security_risk == "HIGH":
             explainability.append("Potential security risks identified")
         
-        return {
-            "valid": True,
-            "violations": [],
-            "corrections": [],
-            "form_coherence": 1.0,
-            "semantic_coherence": 1.0,
-            "arch_coherence": 1.0,
-            "explainability": explainability
-        }
+        return [], [], 1.0, 1.0, 1.0, explainability
     
     def _calculate_question_depth(self, text: str) -> float:
         """Question depth calculation"""
         depth = 0.5  # Base depth
         
         # Deep question traits
-        deep_patterns = [
-            r'\b(why|reason|root|original)\b',
-            r'\b(hypothesis|assumption|alternative)\b',
-            r'[?]{2,}',  # Multiple questions
-            r'\b(if\s+.*\s+then\s*)\?',
-            r'\b(consequence|result|outcome)\b'
-        ]
-        
-        for pattern in deep_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in DEEP_QUESTION_PATTERNS:
+            if pattern.search(text):
                 depth += 0.1
         
         return min(1.0, depth)
     
-    def _assess_structure(self, text: str) -> float:
+    def _assess_structure(self, text: str, word_count: int) -> float:
         """Structural quality assessment"""
         score = 0.0
         
-        sentences = re.split(r'[.!?]', text)
-        if len(sentences) > 1:
+        # More than one sentence means at least one terminator is present
+        if any(terminator in text for terminator in '.!?'):
             score += 0.3
         
-        words = text.split()
-        if len(words) > 5:
+        if word_count > 5:
             score += 0.3
         
         if any(marker in text for marker in [':', ';', '-']):
@@ -886,15 +1087,8 @@ class FormalValidator:
     
     def _assess_security_implication(self, text: str) -> str:
         """Security implication assessment"""
-        risk_patterns = [
-            r'\b(password|key|token|secret|access)\b',
-            r'\b(delete|erase|clear|reset)\b',
-            r'\b(system|core|architecture|security)\s+.*\s+(change|modify)\b'
-        ]
-        
-        for pattern in risk_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "HIGH"
+        if SECURITY_RISK_RE.search(text):
+            return "HIGH"
         
         return "LOW"
 
@@ -902,12 +1096,30 @@ class FormalValidator:
 #  FORMAL NORMALIZER
 # ==========================================
 
+# Normalizer patterns, compiled once at import.
+# Question hints fuse the question-word substrings ('whose' is covered by 'who')
+# with the intonation patterns; 'what/how about' is implied by the bare words.
+QUESTION_HINT_RE = re.compile(
+    r'why|how|what|where|when|who'
+    r'|^.*\?$'
+    r'|\b(?:is|are|can|do|does|will|should|could)\s+.*\?$'
+)
+
+# Dangerous sequences share one alternation, so stripping is a single scan
+DANGER_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'</?script>',
+    r'on\w+=\s*["\'].*?["\']',
+    r'javascript:',
+    r'vbscript:',
+    r'data:'
+)), re.IGNORECASE)
+
 class FormalNormalizer:
     """Formal normalizer with safe auto-correction"""
     
     def __init__(self, engine: FormalResonanceEngine):
         self.engine = engine
-        self.correction_history = []
+        self.correction_history = deque(maxlen=1000)  # Oldest entries drop off in O(1)
         self.max_corrections = 3
     
     async def normalize(self, parsed: Dict, triangle: TriangleColor) -> str:
@@ -935,7 +1147,8 @@ class FormalNormalizer:
         logic_score = parsed.get("logic_score", 0.0)
         if logic_score < 0.5:
             # Add logic markers
-            if ':' not in text and len(text.split()) > 10:
+            # Only "more than ten words" matters, so stop splitting after the eleventh
+            if ':' not in text and len(text.split(None, 10)) > 10:
                 parts = text.split('"')
                 if len(parts) >= 3:
                     content = parts[1]
@@ -968,7 +1181,7 @@ class FormalNormalizer:
             data_id = self.engine._generate_data_id()
             
             # Clear text from dangerous constructs
-            safe_text = self._sanitize_for_json(text)
+            safe_text = self._strip_dangerous(text)
             
             # Create JSON structure
             json_data = {
@@ -1013,7 +1226,7 @@ class FormalNormalizer:
         
         # Log correction
         self.correction_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "triangle": triangle.code,
             "original": text[:100],
             "corrected": corrected[:100],
@@ -1043,57 +1256,18 @@ class FormalNormalizer:
     
     def _is_actually_question(self, text: str) -> bool:
         """Checking if the text is actually a question"""
-        question_words = {'why', 'how', 'what', 'where', 'when', 'who', 'whose'}
         text_lower = text.lower()
         
-        # Check by question words
-        if any(word in text_lower for word in question_words):
-            return True
-        
         # Check by structure
         if text_lower.endswith('?'):
             return True
         
-        # Check by intonation patterns
-        question_patterns = [
-            r'^.*\?$',
-            r'\b(?:is|are|can|do|does|will|should|could)\s+.*\?$',
-            r'\b(?:what|how)\s+about\b'
-        ]
-        
-        for pattern in question_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        # Check by question words and intonation patterns in one scan
+        return QUESTION_HINT_RE.search(text_lower) is not None
     
-    def _sanitize_for_json(self, text: str) -> str:
-        """Text sanitization for safe JSON"""
-        # Escaping special characters
-        replacements = {
-            '"': '\\"',
-            '\n': '\\n',
-            '\r': '\\r',
-            '\t': '\\t',
-            '\\': '\\\\'
-        }
-        
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-        
-        # Removing potentially dangerous sequences
-        danger_patterns = [
-            r'</?script>',
-            r'on\w+=\s*["\'].*?["\']',
-            r'javascript:',
-            r'vbscript:',
-            r'data:'
-        ]
-        
-        for pattern in danger_patterns:
-            text = re.sub(pattern, '[REMOVED]', text, flags=re.IGNORECASE)
-        
-        return text
+    def _strip_dangerous(self, text: str) -> str:
+        """Removing potentially dangerous sequences; JSON escaping is left to the serializer"""
+        return DANGER_RE.sub('[REMOVED]', text)
     
     def _fix_json_structure(self, text: str) -> Optional[str]:
         """Attempting to fix JSON structure"""
@@ -1106,8 +1280,8 @@ class FormalNormalizer:
                     json_str = parts[1].strip()
                     
                     # Attempt to parse
-                    json.loads(json_str)
-                    return text  # Already valid
+                    if _is_valid_json(json_str):
+                        return text  # Already valid
                     
                     # Or attempt to fix
                     # (more complex fix logic can be added here)
@@ -1126,7 +1300,7 @@ class TrinityFSMController:
     def __init__(self):
         self.triangles = {}
         self.active_triangle = None
-        self.transition_log = []
+        self.transition_log = deque(maxlen=1000)  # Oldest entries drop off in O(1)
         self.global_state = "INITIALIZING"
         
     def activate_triangle(self, triangle: TriangleColor) -> bool:
@@ -1180,16 +1354,12 @@ class TrinityFSMController:
     def _log_transition(self, triangle: TriangleColor, action: str):
         """Transitions logging"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "triangle": triangle.code,
             "action": action,
             "state": self.triangles[triangle].current_state.name
         }
         self.transition_log.append(entry)
-        
-        # Limit log size
-        if len(self.transition_log) > 1000:
-            self.transition_log = self.transition_log[-500:]
 
 # ==========================================
 #  THREAT MODEL AND SECURITY
@@ -1261,133 +1431,144 @@ class TrinityThreatModel:
         }
     }
     
+    RECENT_THREAT_WINDOW = 300.0  # Seconds of detections that drive the threat level
+    
+    # Read-only views shared by every detection of the same threat
+    THREAT_TEMPLATES = {threat_id: MappingProxyType(info) for threat_id, info in THREAT_MATRIX.items()}
+    
+    # Threat patterns are compiled once, when the class is defined.
+    # Any injection or semantic hit is a detection, so each family shares one pattern
+    # and a scan makes a single pass per family.
+    INJECTION_RE: re.Pattern = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in [
+            r'[;\{\}\[\]\(\)\"\']\s*[\{\[\("]',
+            r'\b(?:DROP|DELETE|INSERT|UPDATE|SELECT|ALTER|CREATE)\b.*\b(?:TABLE|DATABASE|USER)\b',
+            r'<\s*script\b',
+            r'javascript:',
+            r'on\w+\s*=',
+            r'<\s*iframe\b',
+            r'data:\s*text\/html'
+        ]),
+        re.IGNORECASE
+    )
+    
+    SEMANTIC_RE: re.Pattern = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in [
+            r'^[^?]*\?$',  # Statement with a question
+            r'\b(?:no|not)\s+\?',  # Negation with a question
+            r'[!?]{3,}',  # Multiple signs
+            r'\b(?:this|that)\s+is\s+not\s+\w+\s*\?'  # Contradictory constructions
+        ]),
+        re.IGNORECASE
+    )
+    
+    LONG_LINE_RE = re.compile(r'.{1000,}')  # Very long strings
+    JSON_FLOOD_RE = re.compile(r'\{\s*".*?".*?\}{10,}')  # Multiple JSON objects
+    MULTI_TAG_RE = re.compile(r'#\[.*?\].*?#\[.*?\]')  # Multiple tags
+    RESOURCE_PATTERNS: Tuple[re.Pattern, ...] = (LONG_LINE_RE, JSON_FLOOD_RE, MULTI_TAG_RE)
+    
     def __init__(self):
-        self.detected_threats = []
+        self.detected_threats = deque(maxlen=10_000)  # Time-ordered, oldest dropped first
+        self.total_detected = 0
         self.mitigation_log = []
         self.threat_level = "LOW"
         self.last_scan = datetime.now()
+        
+        # Checks that apply to each triangle, in THREAT_MATRIX order.
+        # T3 (coherence), T4 (FSM) and T5 (normalizer) are checked elsewhere.
+        templates = self.THREAT_TEMPLATES
+        always = [(templates["T6"], self._check_resource_exhaustion)]
+        self._handlers = {triangle: always for triangle in TriangleColor}
+        self._handlers[TriangleColor.RED] = [(templates["T1"], self._check_semantic_corruption)] + always
+        self._handlers[TriangleColor.GREEN] = [(templates["T2"], self._check_json_injection)] + always
     
-    def initialize(self):
+    def initialize(self, log: Callable[[str], None] = print):
         """Defense system initialization"""
-        print("⚡ Initializing threat model...")
+        log("⚡ Initializing threat model...")
         self._load_threat_patterns()
-        self._start_monitoring()
+        self._start_monitoring(log)
     
     def _load_threat_patterns(self):
         """Threat patterns loading"""
         self.patterns = {
-            "injection": self._compile_injection_patterns(),
-            "semantic": self._compile_semantic_patterns(),
-            "resource": self._compile_resource_patterns()
+            "injection": self.INJECTION_RE,
+            "semantic": self.SEMANTIC_RE,
+            "resource": self.RESOURCE_PATTERNS
         }
     
-    def _compile_injection_patterns(self) -> List[re.Pattern]:
-        """Injection patterns compilation"""
-        return [
-            re.compile(pattern, re.IGNORECASE) for pattern in [
-                r'[;\{\}\[\]\(\)\"\']\s*[\{\[\("]',
-                r'\b(?:DROP|DELETE|INSERT|UPDATE|SELECT|ALTER|CREATE)\b.*\b(?:TABLE|DATABASE|USER)\b',
-                r'<\s*script\b',
-                r'javascript:',
-                r'on\w+\s*=',
-                r'<\s*iframe\b',
-                r'data:\s*text\/html'
-            ]
-        ]
-    
-    def _compile_semantic_patterns(self) -> List[re.Pattern]:
-        """Semantic patterns compilation"""
-        return [
-            re.compile(pattern, re.IGNORECASE) for pattern in [
-                r'^[^?]*\?$',  # Statement with a question
-                r'\b(?:no|not)\s+\?',  # Negation with a question
-                r'[!?]{3,}',  # Multiple signs
-                r'\b(?:this|that)\s+is\s+not\s+\w+\s*\?'  # Contradictory constructions
-            ]
-        ]
-    
-    def _compile_resource_patterns(self) -> List[re.Pattern]:
-        """Resource patterns compilation"""
-        return [
-            re.compile(pattern) for pattern in [
-                r'.{1000,}',  # Very long strings
-                r'\{\s*".*?".*?\}{10,}',  # Multiple JSON objects
-                r'#\[.*?\].*?#\[.*?\]',  # Multiple tags
-            ]
-        ]
-    
-    def _start_monitoring(self):
+    def _start_monitoring(self, log: Callable[[str], None] = print):
         """Threat monitoring launch"""
-        print("   Launching threat monitoring...")
+        log("   Launching threat monitoring...")
         # In a real system, background tasks would be started here
     
     def scan_input(self, text: str, triangle: TriangleColor) -> List[Dict]:
         """Scanning input for threats"""
-        threats = []
-        
-        for threat_id, threat_info in self.THREAT_MATRIX.items():
-            if self._check_threat(text, triangle, threat_info):
-                threat_entry = threat_info.copy()
-                threat_entry.update({
-                    "detected_at": datetime.now().isoformat(),
-                    "input_sample": text[:100],
-                    "triangle": triangle.code
-                })
-                threats.append(threat_entry)
-                self.detected_threats.append(threat_entry)
+        threats = self._record_threats(text, triangle, self._detect_threats(text, triangle), time.time())
         
         if threats:
             self._update_threat_level()
         
         return threats
     
-    def _check_threat(self, text: str, triangle: TriangleColor, threat: Dict) -> bool:
-        """Checking specific threat"""
-        threat_id = threat["id"]
-        
-        if threat_id == "T1":  # Semantic Corruption
-            return self._check_semantic_corruption(text, triangle)
-        elif threat_id == "T2":  # JSON Injection
-            return self._check_json_injection(text, triangle)
-        elif threat_id == "T3":  # Coherence Degradation
-            return False  # Checked separately
-        elif threat_id == "T4":  # State Machine Deadlock
-            return False  # Checked in FSM
-        elif threat_id == "T5":  # Recursive Correction
-            return False  # Checked in normalizer
-        elif threat_id == "T6":  # Resource Exhaustion
-            return self._check_resource_exhaustion(text)
+    def scan_batch(self, inputs: List[Tuple[str, TriangleColor]], max_workers: Optional[int] = None) -> List[List[Dict]]:
+        """Scanning many inputs; detection fans out to a thread pool when max_workers > 1"""
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hits = list(executor.map(lambda item: self._detect_threats(*item), inputs))
+        else:
+            hits = [self._detect_threats(text, triangle) for text, triangle in inputs]
         
-        return False
-    
-    def _check_semantic_corruption(self, text: str, triangle: TriangleColor) -> bool:
-        """Semantic corruption check"""
-        if triangle != TriangleColor.RED:
-            return False
+        # Shared state is only touched here, on the calling thread
+        detected_at = time.time()
+        results = [
+            self._record_threats(text, triangle, templates, detected_at)
+            for (text, triangle), templates in zip(inputs, hits)
+        ]
         
-        # Checking contradictory constructions
-        for pattern in self.patterns["semantic"]:
-            if pattern.search(text):
-                return True
+        if any(results):
+            self._update_threat_level()
         
-        return False
+        return results
     
-    def _check_json_injection(self, text: str, triangle: TriangleColor) -> bool:
-        """JSON injection check"""
-        if triangle != TriangleColor.GREEN:
-            return False
-        
-        for pattern in self.patterns["injection"]:
-            if pattern.search(text):
-                return True
-        
-        return False
+    def _detect_threats(self, text: str, triangle: TriangleColor) -> List[MappingProxyType]:
+        """Templates of the threats found in the input; reads only immutable state"""
+        return [template for template, check in self._handlers[triangle] if check(text)]
+    
+    def _record_threats(self, text: str, triangle: TriangleColor,
+                        templates: List[MappingProxyType], detected_at: float) -> List[Dict]:
+        """Logging detections"""
+        threats = []
+        for template in templates:
+            # Static threat fields are referenced, only the detection details are new
+            threat_entry = {
+                "threat": template,
+                "detected_at": detected_at,  # Epoch seconds; formatted for display only
+                "input_sample": text[:100],
+                "triangle": triangle.code
+            }
+            threats.append(threat_entry)
+            self.detected_threats.append(threat_entry)
+            self.total_detected += 1
+        return threats
+    
+    def _check_semantic_corruption(self, text: str) -> bool:
+        """Semantic corruption check (RED only)"""
+        # Checking contradictory constructions
+        return bool(self.patterns["semantic"].search(text))
+    
+    def _check_json_injection(self, text: str) -> bool:
+        """JSON injection check (GREEN only)"""
+        return bool(self.patterns["injection"].search(text))
     
     def _check_resource_exhaustion(self, text: str) -> bool:
         """Resource exhaustion check"""
-        for pattern in self.patterns["resource"]:
-            if pattern.search(text):
-                return True
+        # Each regex runs only when its cheap necessary condition holds
+        if len(text) >= 1000 and self.LONG_LINE_RE.search(text):
+            return True
+        if '}' * 10 in text and self.JSON_FLOOD_RE.search(text):
+            return True
+        if text.count('#[') >= 2 and self.MULTI_TAG_RE.search(text):
+            return True
         
         return False
     
@@ -1398,8 +1579,12 @@ class TrinityThreatModel:
             return
         
         # Analyze latest threats
-        recent_threats = [t for t in self.detected_threats 
-                         if datetime.now() - datetime.fromisoformat(t["detected_at"]) < timedelta(minutes=5)]
+        cutoff = time.time() - self.RECENT_THREAT_WINDOW
+        recent_threats = []
+        for t in reversed(self.detected_threats):  # Newest first, so stop at the first stale entry
+            if t["detected_at"] <= cutoff:
+                break
+            recent_threats.append(t)
         
         if not recent_threats:
             self.threat_level = "LOW"
@@ -1407,7 +1592,7 @@ class TrinityThreatModel:
         
         # Determine maximum severity
         severities = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
-        max_severity = max(severities[t["severity"]] for t in recent_threats)
+        max_severity = max(severities[t["threat"]["severity"]] for t in recent_threats)
         
         if max_severity >= 2:
             self.threat_level = "HIGH"
@@ -1418,21 +1603,21 @@ class TrinityThreatModel:
     
     def get_current_threat_level(self) -> Dict:
         """Getting current threat level"""
-        recent = self.detected_threats[-5:] if self.detected_threats else []
+        recent = list(islice(reversed(self.detected_threats), 5))[::-1]
         
         return {
             "level": self.threat_level,
             "last_scan": self.last_scan.isoformat(),
             "recent_threats": [
                 {
-                    "id": t["id"],
-                    "name": t["name"],
-                    "detected_at": t["detected_at"],
-                    "severity": t["severity"]
+                    "id": t["threat"]["id"],
+                    "name": t["threat"]["name"],
+                    "detected_at": datetime.fromtimestamp(t["detected_at"]).isoformat(),
+                    "severity": t["threat"]["severity"]
                 }
                 for t in recent
             ],
-            "total_detected": len(self.detected_threats)
+            "total_detected": self.total_detected
         }
 
 # ==========================================
@@ -1442,44 +1627,70 @@ class TrinityThreatModel:
 class CoherenceMonitor:
     """System coherence monitoring"""
     
+    PROCESSING_WINDOW = 10  # Samples averaged for the processing time anomaly check
+    COHERENCE_WINDOW = 10  # Samples kept for trend and sharp-change checks
+    
     def __init__(self, engine: FormalResonanceEngine):
         self.engine = engine
-        self.metrics = {
-            "processing_times": [],
-            "coherence_history": [],
-            "violation_counts": {t.code: 0 for t in TriangleColor},
-            "correction_counts": {t.code: 0 for t in TriangleColor},
-            "error_log": [],
-            "performance_log": []
-        }
+        self._reset_metrics()
         self.alerts = []
+        self._alert_seq = count(1)  # Alert IDs stay unique even if old alerts are trimmed
         self.start_time = datetime.now()
     
-    def initialize(self):
+    def initialize(self, log: Callable[[str], None] = print):
         """Initializing monitoring"""
-        print("📊 Initializing coherence monitoring...")
+        log("📊 Initializing coherence monitoring...")
         self._reset_metrics()
     
     def _reset_metrics(self):
         """[ENG] [ENG]"""
+        # Only recent windows are kept; session-wide stats are running aggregates
         self.metrics = {
-            "processing_times": [],
-            "coherence_history": [],
+            "processing_times": deque(maxlen=self.PROCESSING_WINDOW),
+            "coherence_history": deque(maxlen=self.COHERENCE_WINDOW),
             "violation_counts": {t.code: 0 for t in TriangleColor},
             "correction_counts": {t.code: 0 for t in TriangleColor},
-            "error_log": [],
+            "error_log": deque(maxlen=1000),  # Oldest entries drop off in O(1)
             "performance_log": []
         }
+        self._error_count = 0
+        self._processing_count = 0
+        self._processing_sum = 0.0
+        self._processing_window_sum = 0.0
+        self._processing_evictions = 0
+        self._processing_min = 0.0
+        self._processing_max = 0.0
+        self._coherence_count = 0
+        self._coherence_sum = 0.0
     
     def record_processing(self, triangle: TriangleColor, 
                          processing_time: float, 
                          validation: ValidationResult):
         """Recording processing"""
         # Processing time
-        self.metrics["processing_times"].append(processing_time)
+        times = self.metrics["processing_times"]
+        if len(times) == times.maxlen:
+            self._processing_window_sum -= times[0]  # Evicted by the append below
+            self._processing_evictions += 1
+        times.append(processing_time)
+        if self._processing_evictions >= times.maxlen:
+            # Re-sum exactly once per full window turnover so rounding drift never accumulates
+            self._processing_window_sum = math.fsum(times)
+            self._processing_evictions = 0
+        else:
+            self._processing_window_sum += processing_time
+        if self._processing_count:
+            self._processing_min = min(self._processing_min, processing_time)
+            self._processing_max = max(self._processing_max, processing_time)
+        else:
+            self._processing_min = self._processing_max = processing_time
+        self._processing_count += 1
+        self._processing_sum += processing_time
         
         # Coherence
         self.metrics["coherence_history"].append(validation.final_coherence)
+        self._coherence_count += 1
+        self._coherence_sum += validation.final_coherence
         
         # Violations and corrections
         if validation.violations:
@@ -1494,12 +1705,13 @@ class CoherenceMonitor:
     def record_error(self, triangle: TriangleColor, error: str):
         """Recording error"""
         error_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "triangle": triangle.code,
             "error": error,
             "system_state": self.engine.get_system_status()
         }
         self.metrics["error_log"].append(error_entry)
+        self._error_count += 1
         
         # Alert generation
         self._generate_alert("ERROR", f"{triangle.code}: {error}")
@@ -1511,14 +1723,14 @@ class CoherenceMonitor:
         anomalies = []
         
         # Abnormal processing time
-        if len(self.metrics["processing_times"]) > 10:
-            avg_time = sum(self.metrics["processing_times"][-10:]) / 10
+        if self._processing_count > self.PROCESSING_WINDOW:
+            avg_time = self._processing_window_sum / self.PROCESSING_WINDOW
             if processing_time > avg_time * 3:
                 anomalies.append(f"High processing time: {processing_time:.3f}s")
         
         # Sharp coherence drop
-        if len(self.metrics["coherence_history"]) > 5:
-            recent = self.metrics["coherence_history"][-5:]
+        if self._coherence_count > 5:
+            recent = list(self.metrics["coherence_history"])[-5:]
             if max(recent) - min(recent) > 0.5:
                 anomalies.append("Sharp coherence change")
         
@@ -1533,30 +1745,34 @@ class CoherenceMonitor:
     def _generate_alert(self, level: str, message: str):
         """Alert generation"""
         alert = {
-            "id": f"ALERT_{len(self.alerts)+1:06d}",
-            "timestamp": datetime.now().isoformat(),
+            "id": f"ALERT_{next(self._alert_seq):06d}",
+            "timestamp": time.time(),
             "level": level,
             "message": message,
             "acknowledged": False
         }
         self.alerts.append(alert)
     
+    def get_uptime(self) -> float:
+        """Seconds since monitoring started"""
+        return (datetime.now() - self.start_time).total_seconds()
+    
     def get_summary(self) -> Dict:
         """Getting monitoring summary"""
-        if not self.metrics["processing_times"]:
+        if not self._processing_count:
             return {"status": "NO_DATA"}
         
         return {
-            "uptime_seconds": (datetime.now() - self.start_time).total_seconds(),
-            "total_processed": len(self.metrics["processing_times"]),
+            "uptime_seconds": self.get_uptime(),
+            "total_processed": self._processing_count,
             "performance": {
-                "avg_processing_time": sum(self.metrics["processing_times"]) / len(self.metrics["processing_times"]),
-                "max_processing_time": max(self.metrics["processing_times"]) if self.metrics["processing_times"] else 0,
-                "min_processing_time": min(self.metrics["processing_times"]) if self.metrics["processing_times"] else 0
+                "avg_processing_time": self._processing_sum / self._processing_count,
+                "max_processing_time": self._processing_max,
+                "min_processing_time": self._processing_min
             },
             "coherence": {
                 "current": self.metrics["coherence_history"][-1] if self.metrics["coherence_history"] else 1.0,
-                "average": sum(self.metrics["coherence_history"]) / len(self.metrics["coherence_history"]) if self.metrics["coherence_history"] else 1.0,
+                "average": self._coherence_sum / self._coherence_count if self._coherence_count else 1.0,
                 "trend": self._calculate_coherence_trend()
             },
             "violations": self.metrics["violation_counts"],
@@ -1564,17 +1780,20 @@ class CoherenceMonitor:
             "alerts": {
                 "total": len(self.alerts),
                 "unacknowledged": len([a for a in self.alerts if not a["acknowledged"]]),
-                "recent": self.alerts[-5:] if self.alerts else []
+                "recent": [
+                    dict(alert, timestamp=datetime.fromtimestamp(alert["timestamp"]).isoformat())
+                    for alert in self.alerts[-5:]
+                ]
             },
-            "errors": len(self.metrics["error_log"])
+            "errors": self._error_count
         }
     
     def _calculate_coherence_trend(self) -> str:
         """Coherence trend calculation"""
-        if len(self.metrics["coherence_history"]) < 10:
+        if self._coherence_count < self.COHERENCE_WINDOW:
             return "INSUFFICIENT_DATA"
         
-        recent = self.metrics["coherence_history"][-10:]
+        recent = list(self.metrics["coherence_history"])
         first_half = recent[:5]
         second_half = recent[5:]
         
@@ -1595,6 +1814,8 @@ class CoherenceMonitor:
 class IntegratedTrinitySystem:
     """Integrated Trinity System v3.0"""
     
+    AUTOSAVE_INTERVAL = 300  # 5 minutes
+    
     def __init__(self, admin_name: str = "Admin Alex"):
         print("🧠 Initializing Integrated Trinity System v3.0...")
         
@@ -1604,31 +1825,43 @@ class IntegratedTrinitySystem:
         # System state
         self.is_active = True
         self.session_start = datetime.now()
+        self._session_start_monotonic = time.monotonic()
         self.interaction_count = 0
         
-        # Autosave
-        self._setup_autosave()
+        # Interaction-dependent report sections, keyed by the interaction count they were built at
+        self._report_cache: Tuple[int, Optional[Dict]] = (-1, None)
+        
+        # Autosave (started on the running loop by start_autosave / the first communicate call)
+        self._autosave_task: Optional[asyncio.Task] = None
         
         print(f"✅ Integrated Trinity System v3.0 ready")
         print(f"   Session: {self.engine.session_id}")
         print(f"   Start time: {self.session_start.isoformat()}")
     
-    def _setup_autosave(self):
-        """Autosave setup"""
-        import threading
-        
-        def autosave_task():
-            while self.is_active:
-                time.sleep(300)  # 5 minutes
-                if self.is_active:
-                    self.save_state()
-        
-        self.autosave_thread = threading.Thread(target=autosave_task, daemon=True)
-        self.autosave_thread.start()
+    async def _autosave_loop(self):
+        """Periodic autosave; fires only when the event loop is free to run it"""
+        while self.is_active:
+            await asyncio.sleep(self.AUTOSAVE_INTERVAL)
+            if self.is_active:
+                try:
+                    # Snapshot on the loop, so only compression and file I/O leave it
+                    payload = self._encode_state()
+                    await asyncio.to_thread(self._write_state_blob, self._binary_state_filename(), payload)
+                except Exception as e:
+                    # A failed snapshot must not end the task; the next interval retries
+                    print(f"⚠️ Autosave error: {str(e)}")
+    
+    def start_autosave(self):
+        """Schedules the autosave task on the running loop (idempotent)"""
+        if self._autosave_task is None:
+            self._autosave_task = asyncio.create_task(self._autosave_loop())
     
     async def communicate(self, message: str, triangle_code: str) -> Dict:
         """Main communication method"""
+        self.start_autosave()
+        
         self.interaction_count += 1
+        self._report_cache = (-1, None)
         
         print(f"\n[{self.interaction_count}] {triangle_code.upper()}: {message[:50]}...")
         
@@ -1660,21 +1893,76 @@ class IntegratedTrinitySystem:
         # Statistics collection logic can be added here
         pass
     
+    def _report_sections(self):
+        """Report sections in output order, each built only when reached"""
+        yield "system", {
+            "version": "3.0.0",
+            "uptime": time.monotonic() - self._session_start_monotonic,
+            "interactions": self.interaction_count,
+            "is_active": self.is_active,
+            "session_id": self.engine.session_id
+        }
+        sections = self._cached_sections()
+        yield "engine", self._refresh_engine_clocks(sections["engine"])
+        yield "performance", self._refresh_monitor_clock(sections["performance"])
+        yield "threats", self.engine.threat_model.get_current_threat_level()
+    
+    def _cached_sections(self) -> Dict[str, Dict]:
+        """Engine and monitor sections, rebuilt only after a new interaction"""
+        cached_count, sections = self._report_cache
+        if cached_count != self.interaction_count:
+            sections = {
+                "engine": self.engine.get_system_status(),
+                "performance": self.engine.monitor.get_summary()
+            }
+            self._report_cache = (self.interaction_count, sections)
+        return sections
+    
+    def _refresh_engine_clocks(self, status: Dict) -> Dict:
+        """Deep copy of a cached engine status with its time-based fields and threats recomputed"""
+        status = _copy_plain(status)
+        status["session"]["uptime"] = self.engine.get_uptime()
+        for code, stats in status["triangles"].items():
+            stats["active_for"] = self.engine._get_triangle_state(TriangleColor[code]).get_state_duration()
+        status["threats"] = self.engine.threat_model.get_current_threat_level()
+        status["monitoring"] = self._refresh_monitor_clock(status["monitoring"])
+        return status
+    
+    def _refresh_monitor_clock(self, summary: Dict) -> Dict:
+        """Deep copy of a cached monitor summary with a current uptime"""
+        summary = _copy_plain(summary)
+        if "uptime_seconds" in summary:  # NO_DATA summary carries no clock
+            summary["uptime_seconds"] = self.engine.monitor.get_uptime()
+        return summary
+    
+    def get_quick_status(self) -> Tuple[float, int]:
+        """Current coherence and interaction count without building a report"""
+        history = self.engine.coherence_history
+        return (history[-1] if history else 1.0), self.interaction_count
+    
     def get_system_report(self) -> Dict:
         """Getting full system report"""
-        engine_status = self.engine.get_system_status()
-        
+        return dict(self._report_sections())
+    
+    def _stream_report(self, fp, metadata: Dict):
+        """Write the state document one report section at a time"""
+        fp.write(b'{\n  "metadata": ')
+        fp.write(_json_dumps_pretty(metadata).replace(b'\n', b'\n  '))
+        fp.write(b',\n  "system_report": {')
+        separator = b'\n    '
+        for name, section in self._report_sections():
+            fp.write(separator + b'"' + name.encode() + b'": ')
+            fp.write(_json_dumps_pretty(section).replace(b'\n', b'\n    '))
+            separator = b',\n    '
+        fp.write(b'\n  }\n}')
+    
+    def _state_metadata(self) -> Dict:
+        """Header block stored with every saved state"""
         return {
-            "system": {
-                "version": "3.0.0",
-                "uptime": (datetime.now() - self.session_start).total_seconds(),
-                "interactions": self.interaction_count,
-                "is_active": self.is_active,
-                "session_id": self.engine.session_id
-            },
-            "engine": engine_status,
-            "performance": self.engine.monitor.get_summary(),
-            "threats": self.engine.threat_model.get_current_threat_level()
+            "version": "3.0.0",
+            "saved_at": datetime.now().isoformat(),
+            "session_id": self.engine.session_id,
+            "interaction_count": self.interaction_count
         }
     
     def save_state(self, filename: str = None):
@@ -1682,19 +1970,36 @@ class IntegratedTrinitySystem:
         if filename is None:
             filename = f"trinity_state_{self.engine.session_id}.json"
         
-        state = {
-            "metadata": {
-                "version": "3.0.0",
-                "saved_at": datetime.now().isoformat(),
-                "session_id": self.engine.session_id,
-                "interaction_count": self.interaction_count
-            },
-            "system_report": self.get_system_report()
-        }
+        metadata = self._state_metadata()
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            # Write a sibling temp file, then swap it in so readers never see a partial file
+            with _atomic_write(filename, WRITE_BUFFER_SIZE) as f:
+                self._stream_report(f, metadata)
+            
+            print(f"💾 State saved to {filename}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Save error: {str(e)}")
+            return False
+    
+    def _binary_state_filename(self) -> str:
+        """Default path of the compressed state blob"""
+        return f"trinity_state_{self.engine.session_id}.json.zlib"
+    
+    def _encode_state(self) -> bytes:
+        """Compact JSON snapshot of the current state; reads live engine objects"""
+        return _json_dumps_bytes({
+            "metadata": self._state_metadata(),
+            "system_report": dict(self._report_sections())
+        })
+    
+    @staticmethod
+    def _write_state_blob(filename: str, payload: bytes) -> bool:
+        """Compresses an encoded snapshot and swaps it in; touches no engine state"""
+        try:
+            with _atomic_write(filename) as f:
+                f.write(zlib.compress(payload, 3))
             
             print(f"💾 State saved to {filename}")
             return True
@@ -1702,11 +2007,30 @@ class IntegratedTrinitySystem:
             print(f"⚠️ Save error: {str(e)}")
             return False
     
+    def save_state_binary(self, filename: str = None):
+        """Saving system state as zlib-compressed compact JSON"""
+        if filename is None:
+            filename = self._binary_state_filename()
+        try:
+            payload = self._encode_state()
+        except Exception as e:
+            print(f"⚠️ Save error: {str(e)}")
+            return False
+        return self._write_state_blob(filename, payload)
+    
+    @staticmethod
+    def load_state_binary(filename: str) -> Dict:
+        """Loading a state written by save_state_binary"""
+        return _json_loads(zlib.decompress(Path(filename).read_bytes()))
+    
     def shutdown(self):
         """Graceful shutdown"""
         print("\n🔴 Shutting down Trinity System...")
         
         self.is_active = False
+        self._report_cache = (-1, None)
+        if self._autosave_task is not None:
+            self._autosave_task.cancel()
         
         # Finalization
         self.save_state()
@@ -1714,6 +2038,54 @@ class IntegratedTrinitySystem:
         print(f"✅ System terminated. Total interactions: {self.interaction_count}")
         print(f"   Final coherence: {self.engine.monitor.metrics['coherence_history'][-1] if self.engine.monitor.metrics['coherence_history'] else 'N/A'}")
 
+async def _run_with_eager_tasks(coro):
+    """Await coro with the eager task factory installed (Python 3.12+)"""
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await coro
+
+def _read_stdin_line() -> str:
+    """input() without the sys.stdin buffer lock, so a thread parked here cannot wedge interpreter shutdown"""
+    fd = sys.stdin.fileno()
+    line = bytearray()
+    while True:
+        byte = os.read(fd, 1)
+        if not byte:
+            if not line:
+                raise EOFError
+            break
+        if byte == b"\n":
+            break
+        line += byte
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+async def _read_line(prompt: str) -> str:
+    """Prompt and read a line on a daemon thread; a cancelled read never holds up interpreter exit"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result: Optional[str], error: Optional[BaseException]):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def reader():
+        try:
+            result, error = _read_stdin_line(), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            pass  # Loop already closed; nobody is waiting for this line
+
+    print(prompt, end="", flush=True)
+    threading.Thread(target=reader, name="trinity-stdin", daemon=True).start()
+    return await future
+
 # ==========================================
 #  DEMONSTRATION MODE
 # ==========================================
@@ -1809,8 +2181,7 @@ async def demonstration_mode():
     
     # Save report
     report_filename = f"trinity_demo_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_filename, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    _write_json_file(report_filename, report)
     
     print(f"\n📄 Full report saved to: {report_filename}")
     
@@ -1826,6 +2197,14 @@ async def demonstration_mode():
 class TrinityCLI:
     """Command interface for Trinity System"""
     
+    # Lowercased command word -> triangle code
+    TRIANGLE_COMMANDS = {
+        "/gold": "GOLD",
+        "/red": "RED",
+        "/green": "GREEN",
+        "/black": "BLACK"
+    }
+    
     @staticmethod
     def run_interactive():
         """Interactive work mode"""
@@ -1849,58 +2228,52 @@ class TrinityCLI:
         async def process_command():
             import asyncio
             
+            system.start_autosave()
+            
             while True:
                 try:
-                    user_input = input("\ntrinity> ").strip()
+                    # Read off the loop so autosave keeps running while waiting
+                    user_input = (await _read_line("\ntrinity> ")).strip()
                     
                     if not user_input:
                         continue
                     
-                    if user_input.lower() == "/exit":
+                    head, sep, tail = user_input.partition(" ")
+                    command = head.lower()
+                    
+                    if command == "/exit" and not sep:
                         print("Shutting down...")
                         system.shutdown()
                         break
                     
-                    elif user_input.lower() == "/status":
-                        report = system.get_system_report()
-                        status = report["engine"]["coherence"]["current"]
+                    elif command == "/status" and not sep:
+                        status, interactions = system.get_quick_status()
                         level = CoherenceLevel.from_value(status)
-                        print(f"System status: {level.icon} {level.description}")
-                        print(f"Coherence: {status:.2f}")
-                        print(f"Interactions: {system.interaction_count}")
+                        print(f"System status: {level.icon} {level.description}\n"
+                              f"Coherence: {status:.2f}\n"
+                              f"Interactions: {interactions}")
                         
-                    elif user_input.lower() == "/report":
+                    elif command == "/report" and not sep:
                         report = system.get_system_report()
                         report_file = f"trinity_report_{datetime.now().strftime('%H%M%S')}.json"
-                        with open(report_file, 'w', encoding='utf-8') as f:
-                            json.dump(report, f, ensure_ascii=False, indent=2)
+                        await asyncio.to_thread(_write_json_file, report_file, report)
                         print(f"Report saved to {report_file}")
                     
-                    elif user_input.lower().startswith("/save "):
-                        filename = user_input[6:].strip()
-                        if system.save_state(filename):
+                    elif command == "/save" and sep:
+                        filename = tail.strip()
+                        if await asyncio.to_thread(system.save_state, filename):
                             print(f"State saved to {filename}")
                         else:
                             print("Save error")
                     
                     elif user_input.startswith("/"):
                         # Identify triangle
-                        if user_input.lower().startswith("/gold "):
-                            triangle = "GOLD"
-                            message = user_input[6:].strip()
-                        elif user_input.lower().startswith("/red "):
-                            triangle = "RED"
-                            message = user_input[5:].strip()
-                        elif user_input.lower().startswith("/green "):
-                            triangle = "GREEN"
-                            message = user_input[7:].strip()
-                        elif user_input.lower().startswith("/black "):
-                            triangle = "BLACK"
-                            message = user_input[7:].strip()
-                        else:
+                        triangle = TrinityCLI.TRIANGLE_COMMANDS.get(command) if sep else None
+                        if triangle is None:
                             print("Unknown command")
                             continue
                         
+                        message = tail.strip()
                         if not message:
                             print("Enter text after command")
                             continue
@@ -1926,11 +2299,18 @@ class TrinityCLI:
                     print("\n\nInterrupted by user")
                     system.shutdown()
                     break
+                except asyncio.CancelledError:
+                    print("\n\nInterrupted by user")
+                    system.shutdown()
+                    raise
                 except Exception as e:
                     print(f"Error: {str(e)}")
         
-        # Start async processing
-        asyncio.run(process_command())
+        # Start async processing; Ctrl+C cancels the task and asyncio.run re-raises it here
+        try:
+            asyncio.run(_run_with_eager_tasks(process_command()))
+        except KeyboardInterrupt:
+            pass
 
 # ==========================================
 #  ENTRY POINT
@@ -1949,7 +2329,7 @@ if __name__ == "__main__":
     
     if args.mode == "demo":
         print("Starting demonstration mode...")
-        asyncio.run(demonstration_mode())
+        asyncio.run(_run_with_eager_tasks(demonstration_mode()))
     
     elif args.mode == "interactive":
         print("Starting interactive mode...")
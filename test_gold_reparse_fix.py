@@ -0,0 +1,27 @@
+import asyncio
+import os
+import sys
+
+# Fix path to include core
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+from core.trinity_core import FormalResonanceEngine
+
+TEXT = "analyze if x then y, compare z"
+
+async def test_gold_reparse_fix():
+    engine = FormalResonanceEngine()
+    # The parse cache is keyed by text, so GOLD first gets back the RED parse of the same text
+    await engine.process(TEXT, "RED")
+    result = await engine.process(TEXT, "GOLD")
+
+    reference = await FormalResonanceEngine().process(TEXT, "GOLD")
+    print(f"Status: {result['status']}")
+    print(f"Result: {result['result']}")
+    if result['status'] == reference['status'] and result['coherence'] == reference['coherence']:
+        print("✅ GOLD REPARSE FIX VERIFIED: a cached parse from another triangle is not reused.")
+    else:
+        print("❌ GOLD REPARSE FIX FAILED: result differs from a fresh GOLD run.")
+        print(f"Expected: {reference['result']}")
+
+if __name__ == "__main__":
+    asyncio.run(test_gold_reparse_fix())
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+
+# Fix path to include core
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+import core.trinity_core as trinity_core
+from core.trinity_core import CoherenceLevel, IntegratedTrinitySystem, TriangleColor, TrinityState
+
+@dataclass
+class Sample:
+    state: TrinityState
+    level: CoherenceLevel
+
+def encode_both(obj):
+    """Encodes obj with the orjson backend (if installed) and with stdlib json"""
+    saved = trinity_core.HAS_ORJSON
+    outputs = {}
+    try:
+        for use_orjson in (True, False):
+            if use_orjson and not hasattr(trinity_core, "orjson"):
+                continue
+            trinity_core.HAS_ORJSON = use_orjson
+            # Float formatting differs between the backends, so the decoded values are compared
+            outputs[use_orjson] = tuple(
+                json.loads(encode(obj)) for encode in (trinity_core._json_dumps_bytes, trinity_core._json_dumps_pretty)
+            )
+    finally:
+        trinity_core.HAS_ORJSON = saved
+    return outputs
+
+def test_json_backend_fix():
+    payload = {
+        "state": TrinityState.DORMANT,
+        "level": CoherenceLevel.STABLE,
+        "when": datetime(2026, 1, 2, 3, 4, 5, 678901),
+        "sample": Sample(TrinityState.PARSING, CoherenceLevel.OPTIMAL),
+        "by_color": {TriangleColor.GOLD: [TrinityState.EMITTING, 0.5]},
+        "text": "ж ✨"
+    }
+    system = IntegratedTrinitySystem("Admin Alex")
+    report = system.get_system_report()
+
+    ok = True
+    for name, obj in (("payload", payload), ("report", report)):
+        outputs = encode_both(obj)
+        stdlib = outputs[False]
+        if name == "payload" and stdlib[0]["state"] != "DORMANT":
+            ok = False
+            print(f"❌ {name}: enums are not written by name")
+        if True in outputs and outputs[True] != stdlib:
+            ok = False
+            print(f"❌ {name}: orjson and stdlib output differ")
+            print(f"orjson: {outputs[True][0]}")
+            print(f"stdlib: {stdlib[0]}")
+    if ok:
+        print("✅ JSON BACKEND FIX VERIFIED: orjson and stdlib write the same state values.")
+
+if __name__ == "__main__":
+    test_json_backend_fix()